@@ -5,6 +5,7 @@ import os
 import json
 import calendar
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Optional
 from datetime import datetime, time
@@ -141,8 +142,15 @@ def _province_from_region(region: Optional[str]) -> Optional[str]:
         return region.split(",")[-1].strip()
     return region.strip()
 
-def _load_json(path: Path) -> dict:
+@lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    """(경로, mtime) 단위로 파싱 결과를 캐시한다. 반환값은 수정하지 말고 읽기만 할 것."""
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+def _load_json(path: Path, *, cached: bool = False) -> dict:
     try:
+        if cached:
+            return _load_json_cached(str(path), path.stat().st_mtime_ns)
         return json.loads(path.read_text(encoding="utf-8"))
     except Exception as exc:  # pylint: disable=broad-except
         print(f"⚠️ JSON 로드 실패: {path} ({exc})")
@@ -1450,8 +1458,8 @@ def _build_capex_approval_values(data_dir: Path) -> dict[str, str]:
     general_path = data_dir / "general.json"
     opex_path = data_dir / "opex_year1.json"
 
-    general = _load_json(general_path)
-    opex = _load_json(opex_path)
+    general = _load_json(general_path, cached=True)
+    opex = _load_json(opex_path, cached=True)
 
     projects = general.get("projects") or []
     total_capacity = 0.0
@@ -7,14 +7,18 @@ AIRUN PPTX Generator 전체 테스트
 
 import sys
 import os
-import json
+import re
+from bisect import bisect_left
+from copy import deepcopy
 from pathlib import Path
 from typing import Any
 from datetime import datetime
 
+from lxml import etree
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml.ns import qn
 from pptx.util import Inches, Pt
 
 
@@ -33,80 +37,292 @@ try:
     from capex_content_builder import (
         build_content_list_from_api,
         _build_capex_approval_values,
+        _load_json_cached,
         _build_technical_solution_text,
     )
 except ModuleNotFoundError:
     from pv_solar.capex_content_builder import (
         build_content_list_from_api,
         _build_capex_approval_values,
+        _load_json_cached,
         _build_technical_solution_text,
     )
 
 
-def _apply_approval_request_replacements(pptx_path: Path, replacements: dict[str, str], slide_index: int = 3) -> None:
+_A_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+_FILL_TAGS = frozenset(qn(f"a:{tag}") for tag in ("noFill", "solidFill", "gradFill", "blipFill", "pattFill", "grpFill"))
+_SOLID_FILL_TEMPLATE = etree.fromstring(
+    '<a:solidFill xmlns:a="%s"><a:srgbClr val="000000"/></a:solidFill>' % _A_NS["a"]
+)
+
+
+# 후처리에서 반복 사용하는 크기/색상/위치 상수 (Pt/Inches/RGBColor는 불변 객체라 공유 가능)
+_PT0 = Pt(0)
+_PT1 = Pt(1)
+_PT2 = Pt(2)
+_PT8 = Pt(8)
+_PT8_8 = Pt(8.8)
+_PT9 = Pt(9)
+_PT10 = Pt(10)
+_PT12 = Pt(12)
+_PT14 = Pt(14)
+_PT30 = Pt(30)
+_RGB_BLACK = RGBColor(0, 0, 0)
+_RGB_TITLE = RGBColor(68, 114, 196)
+_RGB_SUBTITLE = RGBColor(96, 68, 42)
+_RGB_SECTION = RGBColor(0, 79, 153)
+_RGB_BULLET = RGBColor(56, 56, 56)
+# (left, top, width, height)
+_TITLE_BOX = (Inches(0.2), Inches(0.2), Inches(12.9), Inches(0.5))
+_COD_SUBTITLE1_BOX = (Inches(0.2), Inches(0.72), Inches(3.4), Inches(0.28))
+_COD_SUBTITLE2_BOX = (Inches(7.2), Inches(0.72), Inches(3.6), Inches(0.28))
+_COD_BODY_BOX = (Inches(7.2), Inches(1.05), Inches(5.9), Inches(6.2))
+_COD_TABLE_BOX = (Inches(0.2), Inches(1.05), Inches(6.8), Inches(6.0))
+# COD pipeline 표 컬럼 수별 너비(EMU): 표 전체 너비 × 비율을 import 시 한 번만 계산
+_COD_COL_WIDTHS = {
+    col_count: tuple(int(int(_COD_TABLE_BOX[2]) * ratio) for ratio in ratios)
+    for col_count, ratios in (
+        (7, (0.10, 0.09, 0.06, 0.30, 0.17, 0.13, 0.15)),
+        (8, (0.08, 0.08, 0.06, 0.28, 0.14, 0.12, 0.12, 0.12)),
+    )
+}
+_EQUIP_BODY_BOX = (Inches(0.24), Inches(0.95), Inches(12.8), Inches(1.55))
+_EQUIP_TITLE_MAX_TOP = Inches(1.2)
+# PROJECT DETAIL 값 칸: 라벨 우측 간격/너비, 6pt 표 영역 시작 top(EMU), CUBICLE Company 셀 탐색 범위
+_DETAIL_VALUE_GAP = Inches(0.02)
+_DETAIL_TEXT_WIDTH = Inches(1.9)
+_DETAIL_NUMBER_WIDTH = Inches(1.35)
+_DETAIL_TABLE_TOP = int(Inches(2.55))
+_CUBICLE_COMPANY_MIN_OFFSET = int(Inches(0.10))
+_CUBICLE_COMPANY_MAX_OFFSET = int(Inches(0.80))
+# PROJECT DETAIL 라벨 판별: Δ+ 라벨 변형(소문자·공백 제거 기준, "δ+" 포함은 별도 검사), CUBICLE 헤더 표식
+_DELTA_LABELS = frozenset({"d+", "a+", "△+"})
+_CUBICLE_MARK = "CUBICLE [1200kVA]"
+_PV_MONITORING_MARK = "PV MONITORING"
+# general.json COD date의 일반 형태("YYYY-MM-DD..."): 예외 처리 없이 날짜만 바로 추출
+_COD_DATE_RE = re.compile(r"^\s*(\d{4})-(\d{2})-(\d{2})")
+
+
+# COD pipeline 템플릿 placeholder 토큰 → 역할. 한 번의 스캔으로 모든 토큰을 찾고,
+# 여러 역할이 함께 나오면 _COD_SHAPE_PRIORITY 순서(기존 if/elif 우선순위)로 결정한다.
+_COD_SHAPE_PATTERN = re.compile(
+    r"(?P<title>BOLT#2 is Korean PV Portfolio)"
+    r"|(?P<subtitle1>서비타이틀1|서비스타이틀1|서브타이틀1)"
+    r"|(?P<subtitle2>서브타이틀2)"
+    r"|(?P<body>텍스트 영역|왼쪽)"
+)
+_COD_SHAPE_PRIORITY = ("title", "subtitle1", "subtitle2", "body")
+
+
+def _classify_cod_shape(text: str) -> str | None:
+    roles = {m.lastgroup for m in _COD_SHAPE_PATTERN.finditer(text)}
+    return next((role for role in _COD_SHAPE_PRIORITY if role in roles), None)
+
+
+_TC_BORDERS_TEMPLATE = etree.fromstring(
+    '<a:tcBorders xmlns:a="%s">'
+    '<a:top val="single" w="9000" color="2A2A2A"/>'
+    '<a:left val="single" w="9000" color="2A2A2A"/>'
+    '<a:bottom val="single" w="9000" color="2A2A2A"/>'
+    '<a:right val="single" w="9000" color="2A2A2A"/>'
+    '</a:tcBorders>' % _A_NS["a"]
+)
+
+
+def _apply_tc_pr(tc, fill_hex: str) -> None:
+    """표 셀 <a:tcPr>의 테두리/배경을 미리 만든 템플릿 복사본으로 한 번에 교체한다."""
+    tc_pr = tc.find(qn("a:tcPr"))
+    if tc_pr is None:
+        tc_pr = etree.SubElement(tc, qn("a:tcPr"))
+    for existing in [c for c in tc_pr if c.tag in (qn("a:tcBorders"), qn("a:solidFill"))]:
+        tc_pr.remove(existing)
+    solid_fill = deepcopy(_SOLID_FILL_TEMPLATE)
+    solid_fill[0].set("val", fill_hex)
+    tc_pr.append(deepcopy(_TC_BORDERS_TEMPLATE))
+    tc_pr.append(solid_fill)
+
+
+def _tc_text(tc) -> str:
+    """표 셀(<a:tc>) 텍스트를 cell.text처럼 문단 단위 줄바꿈으로 이어 proxy 객체 없이 반환한다."""
+    return "\n".join(
+        "".join(t.text or "" for t in p.iter(qn("a:t")))
+        for p in tc.findall("./a:txBody/a:p", _A_NS)
+    )
+
+
+def _first_paragraph_runs(tc) -> list[Any]:
+    """표 셀(<a:tc>)의 첫 문단 <a:r> 목록을 proxy 객체 없이 반환한다."""
+    p = tc.find("./a:txBody/a:p", _A_NS)
+    return [] if p is None else p.findall("./a:r", _A_NS)
+
+
+def _set_run_style(r, *, size: int | None = None, bold: bool | None = None, rgb: str | None = None) -> bool:
+    """font descriptor를 거치지 않고 <a:rPr>에 크기(pt)/굵기/색상을 직접 기록한다. 변경 여부를 반환한다."""
+    rPr = r.get_or_add_rPr()
+    changed = False
+    if size is not None and rPr.get("sz") != str(size * 100):
+        rPr.set("sz", str(size * 100))
+        changed = True
+    if bold is not None and rPr.get("b") != ("1" if bold else "0"):
+        rPr.set("b", "1" if bold else "0")
+        changed = True
+    if rgb is None:
+        return changed
+    solid_fill = rPr.find(qn("a:solidFill"))
+    if solid_fill is None:
+        for child in [c for c in rPr if c.tag in _FILL_TAGS]:
+            rPr.remove(child)
+        solid_fill = deepcopy(_SOLID_FILL_TEMPLATE)
+        rPr.insert(1 if len(rPr) and rPr[0].tag == qn("a:ln") else 0, solid_fill)
+        changed = True
+    srgb_clr = solid_fill.find(qn("a:srgbClr"))
+    if srgb_clr is None:
+        for child in list(solid_fill):
+            solid_fill.remove(child)
+        srgb_clr = etree.SubElement(solid_fill, qn("a:srgbClr"))
+        changed = True
+    if srgb_clr.get("val") != rgb:
+        srgb_clr.set("val", rgb)
+        changed = True
+    return changed
+
+
+def _set_bbox(shape, box: tuple[int, int, int, int]) -> None:
+    """(left, top, width, height) EMU 값을 <a:off>/<a:ext>에 직접 한 번에 기록한다."""
+    left, top, width, height = box
+    xfrm = shape._element.get_or_add_xfrm()
+    off = xfrm.get_or_add_off()
+    ext = xfrm.get_or_add_ext()
+    off.set("x", str(int(left)))
+    off.set("y", str(int(top)))
+    ext.set("cx", str(int(width)))
+    ext.set("cy", str(int(height)))
+
+
+def _snapshot_shapes(slide, shape_list: list[Any] | None = None) -> list[tuple[Any, bool, str, int, int, int, int]]:
+    """슬라이드 shape 트리를 한 번만 순회해 (shape, has_tf, text, left, top, width, height)로 캐시한다.
+
+    shape_list(호출자가 이미 만든 shape wrapper 목록)가 있으면 slide.shapes 대신 그것을 순회한다.
+    """
+    snapshot: list[tuple[Any, bool, str, int, int, int, int]] = []
+    for shape in (slide.shapes if shape_list is None else shape_list):
+        has_tf = bool(getattr(shape, "has_text_frame", False))
+        text = str(shape.text_frame.text or "").strip() if has_tf else ""
+        snapshot.append((
+            shape,
+            has_tf,
+            text,
+            int(shape.left or 0),
+            int(shape.top or 0),
+            int(shape.width or 0),
+            int(shape.height or 0),
+        ))
+    return snapshot
+
+
+def _open_presentation(pptx_path: Path, prs: Any = None) -> tuple[Any, bool]:
+    """prs가 주어지면 그대로 쓰고(저장은 호출자 몫), 없으면 파일을 열어 (prs, 직접 저장 여부)를 반환한다."""
+    if prs is not None:
+        return prs, False
+    return Presentation(str(pptx_path)), True
+
+
+def _add_textboxes(slide, boxes: list[tuple[int, int, int, int]]) -> list[Any]:
+    """(left, top, width, height) 목록의 텍스트박스를 한 번에 추가한다.
+
+    python-pptx turbo-add 모드로 shape id 최대값을 한 번만 계산하고 이후에는 1씩 증가시킨다.
+    """
+    shapes = slide.shapes
+    turbo = shapes.turbo_add_enabled
+    shapes.turbo_add_enabled = True
+    try:
+        return [shapes.add_textbox(left, top, width, height) for left, top, width, height in boxes]
+    finally:
+        shapes.turbo_add_enabled = turbo
+
+
+def _apply_approval_request_replacements(pptx_path: Path,
+                                         replacements: dict[str, str],
+                                         slide_index: int = 3,
+                                         *,
+                                         prs: Any = None) -> None:
     pptx_path = Path(pptx_path)
-    prs = Presentation(str(pptx_path))
+    prs, owns_prs = _open_presentation(pptx_path, prs)
     if slide_index >= len(prs.slides):
         return
 
     slide = prs.slides[slide_index]
+    dirty = False
     for shape in slide.shapes:
         if not getattr(shape, "has_text_frame", False):
             continue
         text_frame = getattr(shape, "text_frame", None)
         if text_frame is None:
             continue
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                text = run.text
-                for target, value in replacements.items():
-                    if target in text:
-                        run.text = text.replace(target, value)
-
-    prs.save(str(pptx_path))
+        for r in text_frame._txBody.xpath('./a:p/a:r'):
+            text = r.text
+            for target, value in replacements.items():
+                if target in text:
+                    r.text = text.replace(target, value)
+                    dirty = True
+
+    if dirty and owns_prs:
+        prs.save(str(pptx_path))
 
 
-def prune_slides(pptx_path: Path, keep: int) -> None:
+def prune_slides(pptx_path: Path, keep: int, *, prs: Any = None) -> None:
     """생성 후 슬라이드 개수를 기대치에 맞춰 정리한다."""
 
     pptx_path = Path(pptx_path)
-    prs = Presentation(str(pptx_path))
+    prs, owns_prs = _open_presentation(pptx_path, prs)
     if len(prs.slides) <= keep:
         return
 
+    # 뒤쪽 sldId를 슬라이스로 한 번에 제거 (remove()의 선형 탐색 반복을 피함)
     sld_id_lst = prs.slides._sldIdLst
-    while len(sld_id_lst) > keep:
-        sld_id_lst.remove(sld_id_lst[-1])
+    del sld_id_lst[keep:]
 
-    prs.save(str(pptx_path))
+    if owns_prs:
+        prs.save(str(pptx_path))
     print(f"⚙️  불필요 슬라이드 제거: 총 {len(prs.slides)}장으로 정리")
 
 
+_AGREEMENT_TOKENS = ("{{agreement_", "{agreement_", "<<agreement_")
+
+
+def _has_main_agreements_markers(text: str) -> bool:
+    has_placeholder_token = any(token in text for token in _AGREEMENT_TOKENS)
+    has_column_headers = ("Current Status" in text) and ("Next Steps" in text)
+    return has_placeholder_token or has_column_headers
+
+
 def apply_main_agreements_slide(pptx_path: Path,
                                 slide_idx: int,
                                 title_text: str,
                                 table_headers: list[str],
-                                table_rows: list[list[str]]) -> None:
+                                table_rows: list[list[str]],
+                                *,
+                                prs: Any = None,
+                                shape_list: list[Any] | None = None) -> None:
+    """Main Agreements 슬라이드의 placeholder/컬럼 값을 채운다.
+
+    입력 행이 없거나 템플릿 토큰이 없으면 파일을 저장하지 않고 그대로 반환한다.
+    prs를 넘기면 열려 있는 Presentation에 적용만 하고 저장은 호출자가 한다.
+    """
     pptx_path = Path(pptx_path)
-    prs = Presentation(str(pptx_path))
-    if slide_idx >= len(prs.slides):
+    if not table_rows:
         return
 
-    slide = prs.slides[slide_idx]
-    if not table_rows:
-        prs.save(str(pptx_path))
+    prs, owns_prs = _open_presentation(pptx_path, prs)
+    if slide_idx >= len(prs.slides):
         return
+    slide = prs.slides[slide_idx]
+
+    shapes = _snapshot_shapes(slide, shape_list)
+    text_shapes = [entry for entry in shapes if entry[1]]
 
     # 템플릿에 placeholder/컬럼 헤더가 없는 경우 조용히 스킵
-    template_texts: list[str] = []
-    for shape in slide.shapes:
-        if getattr(shape, "has_text_frame", False):
-            template_texts.append(str(getattr(shape, "text", "") or "").strip())
-    joined_template_text = "\n".join(template_texts)
-    has_placeholder_token = any(token in joined_template_text for token in ("{{agreement_", "{agreement_", "<<agreement_"))
-    has_column_headers = ("Current Status" in joined_template_text) and ("Next Steps" in joined_template_text)
-    if not has_placeholder_token and not has_column_headers:
-        prs.save(str(pptx_path))
+    if not _has_main_agreements_markers("\n".join(text for _, _, text, *_ in text_shapes)):
         return
 
     default_text = "입력"
@@ -138,88 +354,65 @@ def apply_main_agreements_slide(pptx_path: Path,
         return replacements
 
     replacements = build_replacements(table_rows)
+    # 긴 토큰 우선: "{{agreement_1}}"가 "{agreement_1}"보다 먼저 매칭되도록 정렬
+    token_pattern = re.compile("|".join(re.escape(t) for t in sorted(replacements, key=len, reverse=True)))
 
-
-    def replace_in_text_frame(text_frame, mapping: dict[str, str]) -> bool:
+    def replace_in_text_frame(text_frame) -> bool:
         changed = False
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                text = run.text
-                if not text:
-                    continue
-                new_text = text
-                for target, value in mapping.items():
-                    if target in new_text:
-                        new_text = new_text.replace(target, value)
-                if new_text != text:
-                    run.text = new_text
-                    changed = True
+        for r in text_frame._txBody.xpath('./a:p/a:r'):
+            text = r.text
+            if not text:
+                continue
+            new_text = token_pattern.sub(lambda m: replacements[m.group(0)], text)
+            if new_text != text:
+                r.text = new_text
+                changed = True
         return changed
 
     replaced_any = False
-    for shape in slide.shapes:
-        if not getattr(shape, "has_text_frame", False):
-            continue
-        text_frame = getattr(shape, "text_frame", None)
-        if text_frame is None:
-            continue
-        if replace_in_text_frame(text_frame, replacements):
+    for shape, *_ in (text_shapes if replacements else []):
+        if replace_in_text_frame(shape.text_frame):
             replaced_any = True
 
-    def _find_header_shape(text: str) -> Any | None:
-        for shape in slide.shapes:
-            if not getattr(shape, "has_text_frame", False):
-                continue
-            if str(getattr(shape, "text", "") or "").strip() == text:
-                return shape
-        return None
+    # 헤더 텍스트 → shape, 컬럼 후보(크기 조건 충족) 인덱스를 스냅샷에서 한 번만 구성
+    header_index: dict[str, tuple] = {}
+    for entry in text_shapes:
+        header_index.setdefault(entry[2], entry)
+    column_candidates = [
+        (float(entry[3]) + float(entry[5]) / 2.0, entry)
+        for entry in text_shapes
+        if entry[5] >= 2000000 and 700000 <= entry[6] <= 1400000
+    ]
 
-    def _collect_column_shapes(header_shape: Any | None,
-                               min_width: int = 2000000,
-                               min_height: int = 700000,
-                               max_height: int = 1400000) -> list[Any]:
-        if not header_shape:
+    def _collect_column_shapes(header: tuple | None) -> list[tuple]:
+        if not header:
             return []
-        header_center = float(header_shape.left) + float(header_shape.width) / 2.0
-        header_bottom = int(header_shape.top) + int(header_shape.height)
-        candidates: list[tuple[float, Any]] = []
-        for shape in slide.shapes:
-            if not getattr(shape, "has_text_frame", False):
-                continue
-            if int(shape.width) < min_width:
-                continue
-            if int(shape.height) < min_height or int(shape.height) > max_height:
-                continue
-            if int(shape.top) <= header_bottom:
-                continue
-            center = float(shape.left) + float(shape.width) / 2.0
-            candidates.append((abs(center - header_center), shape))
-        if not candidates:
+        _, _, _, h_left, h_top, h_width, h_height = header
+        header_center = float(h_left) + float(h_width) / 2.0
+        header_bottom = h_top + h_height
+        below = [(center, entry) for center, entry in column_candidates if entry[4] > header_bottom]
+        if not below:
             return []
-        best_left = int(min(candidates, key=lambda x: x[0])[1].left)
-        return [shape for _, shape in candidates if int(shape.left) == best_left]
+        dists = [abs(center - header_center) for center, _ in below]
+        best_left = below[dists.index(min(dists))][1][3]
+        return sorted((entry for _, entry in below if entry[3] == best_left), key=lambda e: e[4])
 
-    def _fill_column(shapes: list[Any], values: list[str], fill_missing: str | None = None) -> bool:
-        if not shapes:
+    def _fill_column(entries: list[tuple], values: list[str], fill_missing: str | None = None) -> bool:
+        if not entries:
             return False
-        ordered = sorted(shapes, key=lambda s: int(s.top))
         extended = list(values)
-        if fill_missing is not None and len(extended) < len(ordered):
-            extended.extend([fill_missing] * (len(ordered) - len(extended)))
+        if fill_missing is not None and len(extended) < len(entries):
+            extended.extend([fill_missing] * (len(entries) - len(extended)))
         filled = False
-        for shape, value in zip(ordered, extended):
+        for (shape, *_), value in zip(entries, extended):
             if value is None:
                 continue
-            if not getattr(shape, "has_text_frame", False):
-                continue
             shape.text_frame.text = value
             filled = True
         return filled
 
-    current_header = _find_header_shape("Current Status")
-    next_header = _find_header_shape("Next Steps")
-    current_shapes = _collect_column_shapes(current_header)
-    next_shapes = _collect_column_shapes(next_header)
+    current_shapes = _collect_column_shapes(header_index.get("Current Status"))
+    next_shapes = _collect_column_shapes(header_index.get("Next Steps"))
 
     current_values = [
         _normalize_value(row[2], fill_default=True) if len(row) > 2 else default_text
@@ -233,25 +426,39 @@ def apply_main_agreements_slide(pptx_path: Path,
     filled_current = _fill_column(current_shapes, current_values, fill_missing=default_text)
     filled_next = _fill_column(next_shapes, next_values, fill_missing=default_text)
 
-    if not replaced_any and not (filled_current or filled_next):
+    dirty = replaced_any or filled_current or filled_next
+    if not dirty:
         print("[INFO] Main Agreements template placeholders were not matched; skipped text replacement.")
 
     # 요청사항: 제목을 제외한 표/본문 폰트는 9pt로 고정
     title_norm = (title_text or "").strip().lower()
-    for shape in slide.shapes:
-        if not getattr(shape, "has_text_frame", False):
+    for shape, _, shape_text, *_ in text_shapes:
+        if shape_text.lower() == title_norm:
             continue
-        text_frame = getattr(shape, "text_frame", None)
-        if text_frame is None:
-            continue
-        shape_text = str(getattr(shape, "text", "") or "").strip().lower()
-        if shape_text == title_norm:
-            continue
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                run.font.size = Pt(9)
+        for r in shape.text_frame._txBody.xpath('./a:p/a:r'):
+            if _set_run_style(r, size=9):
+                dirty = True
+
+    if dirty and owns_prs:
+        prs.save(str(pptx_path))
+
 
-    prs.save(str(pptx_path))
+def _classify_technical_lines(text: str, is_construction_notes: bool) -> list[tuple[str, str]]:
+    """본문 텍스트를 한 번만 훑어 (kind, 출력 문자열) 목록으로 분류한다."""
+    classified: list[tuple[str, str]] = []
+    for raw in (text or "").splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if is_construction_notes and line.lower().startswith(("engineering", "procurement", "construction")):
+            classified.append(("section", line))
+        elif line == "Equipment Configuration Summary":
+            classified.append(("equipment_title", line))
+        elif line.startswith("-"):
+            classified.append(("bullet", f"▪  {line.lstrip('- ').strip()}"))
+        else:
+            classified.append(("plain", line))
+    return classified
 
 
 def apply_cod_pipeline_slide(pptx_path: Path,
@@ -259,11 +466,14 @@ def apply_cod_pipeline_slide(pptx_path: Path,
                              title_text: str,
                              technical_solution_text: str,
                              table_title_1: str,
-                             subtitle_2: str) -> None:
+                             subtitle_2: str,
+                             *,
+                             prs: Any = None,
+                             shape_list: list[Any] | None = None) -> None:
     """COD pipeline 슬라이드의 템플릿 잔여 placeholder 텍스트를 정리한다."""
 
     pptx_path = Path(pptx_path)
-    prs = Presentation(str(pptx_path))
+    prs, owns_prs = _open_presentation(pptx_path, prs)
     if slide_idx >= len(prs.slides):
         return
 
@@ -273,36 +483,26 @@ def apply_cod_pipeline_slide(pptx_path: Path,
     subtitle1_shape = None
     subtitle2_shape = None
     title_shape = None
-    for shape in slide.shapes:
-        if not getattr(shape, "has_text_frame", False):
+    if shape_list is None:
+        shape_list = list(slide.shapes)
+    for shape, has_tf, text, *_ in _snapshot_shapes(slide, shape_list):
+        if not has_tf or not text:
             continue
+        tf = shape.text_frame
 
-        tf = getattr(shape, "text_frame", None)
-        if tf is None:
-            continue
-        text = str(getattr(shape, "text", "") or "").strip()
-        if not text:
-            continue
-
-        # 제목은 content 기준으로 재확인
-        if text == title_text or "BOLT#2 is Korean PV Portfolio" in text:
+        # 제목은 content 기준으로 재확인, 서브타이틀 1/2 채우기,
+        # 서브타이틀2 하단 본문 placeholder를 실제 본문으로 치환
+        role = "title" if text == title_text else _classify_cod_shape(text.replace("\xa0", ""))
+        if role == "title":
             title_shape = shape
             tf.text = title_text
-            continue
-
-        # 서브타이틀 1/2 채우기
-        compact = text.replace("\xa0", "")
-        if "서비타이틀1" in compact or "서비스타이틀1" in compact or "서브타이틀1" in compact:
+        elif role == "subtitle1":
             subtitle1_shape = shape
             tf.text = table_title_1
-            continue
-        if "서브타이틀2" in compact:
+        elif role == "subtitle2":
             subtitle2_shape = shape
             tf.text = subtitle_2
-            continue
-
-        # 서브타이틀2 하단 본문 placeholder를 실제 본문으로 치환
-        if "텍스트 영역" in text or "왼쪽" in text:
+        elif role == "body":
             technical_shape = shape
             tf.clear()
 
@@ -311,132 +511,84 @@ def apply_cod_pipeline_slide(pptx_path: Path,
     if technical_shape is not None:
         tf = getattr(technical_shape, "text_frame", None)
         if tf is None:
-            prs.save(str(pptx_path))
+            if owns_prs:
+                prs.save(str(pptx_path))
             return
         tf.clear()
         tf.word_wrap = True
         tf.vertical_anchor = MSO_ANCHOR.TOP
 
-        lines = [ln.strip() for ln in (technical_solution_text or "").splitlines() if ln.strip()]
-
-        for idx, line in enumerate(lines):
+        # kind → (bold, size, color)
+        line_styles = {
+            "section": (True, _PT10, _RGB_SECTION),
+            "equipment_title": (True, _PT14, _RGB_BLACK),
+            "bullet": (False, _PT9 if is_construction_notes else _PT10, _RGB_BULLET),
+            "plain": (True, _PT10 if is_construction_notes else _PT12, _RGB_BLACK),
+        }
+        line_spacing = 1.15 if is_construction_notes else 1.0
+        space_after = _PT2 if is_construction_notes else _PT1
+
+        for idx, (kind, line) in enumerate(_classify_technical_lines(technical_solution_text, is_construction_notes)):
             paragraph = tf.paragraphs[0] if idx == 0 else tf.add_paragraph()
             paragraph.alignment = PP_ALIGN.LEFT
-            paragraph.line_spacing = 1.15 if is_construction_notes else 1.0
-            paragraph.space_before = Pt(0)
-            paragraph.space_after = Pt(2 if is_construction_notes else 1)
+            paragraph.line_spacing = line_spacing
+            paragraph.space_before = _PT0
+            paragraph.space_after = space_after
 
+            bold, size, color = line_styles[kind]
             run = paragraph.add_run()
-            if is_construction_notes and line.lower().startswith(("engineering", "procurement", "construction")):
-                run.text = line
-                run.font.bold = True
-                run.font.size = Pt(10)
-                run.font.color.rgb = RGBColor(0, 79, 153)
-            elif line == "Equipment Configuration Summary":
-                run.text = line
-                run.font.bold = True
-                run.font.size = Pt(14)
-                run.font.color.rgb = RGBColor(0, 0, 0)
-            elif line.startswith("-"):
-                run.text = f"▪  {line.lstrip('- ').strip()}"
-                run.font.bold = False
-                run.font.size = Pt(9 if is_construction_notes else 10)
-                run.font.color.rgb = RGBColor(56, 56, 56)
-            else:
-                run.text = line
-                run.font.bold = True
-                run.font.size = Pt(10 if is_construction_notes else 12)
-                run.font.color.rgb = RGBColor(0, 0, 0)
+            run.text = line
+            run.font.bold = bold
+            run.font.size = size
+            run.font.color.rgb = color
 
     # 레이아웃 위치/크기 보정 (레퍼런스 이미지 비율 반영)
     if title_shape is not None:
-        title_shape.left = Inches(0.2)
-        title_shape.top = Inches(0.2)
-        title_shape.width = Inches(12.9)
-        title_shape.height = Inches(0.5)
+        _set_bbox(title_shape, _TITLE_BOX)
         tf = getattr(title_shape, "text_frame", None)
         if tf is not None and tf.paragraphs:
             p = tf.paragraphs[0]
             p.alignment = PP_ALIGN.LEFT
             if p.runs:
                 run = p.runs[0]
-                run.font.size = Pt(30)
+                run.font.size = _PT30
                 run.font.bold = True
-                run.font.color.rgb = RGBColor(68, 114, 196)
+                run.font.color.rgb = _RGB_TITLE
     if subtitle1_shape is not None:
-        subtitle1_shape.left = Inches(0.2)
-        subtitle1_shape.top = Inches(0.72)
-        subtitle1_shape.width = Inches(3.4)
-        subtitle1_shape.height = Inches(0.28)
+        _set_bbox(subtitle1_shape, _COD_SUBTITLE1_BOX)
         tf = getattr(subtitle1_shape, "text_frame", None)
         if tf is not None and tf.paragraphs and tf.paragraphs[0].runs:
             run = tf.paragraphs[0].runs[0]
-            run.font.size = Pt(14)
+            run.font.size = _PT14
             run.font.bold = False
-            run.font.color.rgb = RGBColor(96, 68, 42)
+            run.font.color.rgb = _RGB_SUBTITLE
     if subtitle2_shape is not None:
-        subtitle2_shape.left = Inches(7.2)
-        subtitle2_shape.top = Inches(0.72)
-        subtitle2_shape.width = Inches(3.6)
-        subtitle2_shape.height = Inches(0.28)
+        _set_bbox(subtitle2_shape, _COD_SUBTITLE2_BOX)
         tf = getattr(subtitle2_shape, "text_frame", None)
         if tf is not None and tf.paragraphs and tf.paragraphs[0].runs:
             run = tf.paragraphs[0].runs[0]
-            run.font.size = Pt(14)
+            run.font.size = _PT14
             run.font.bold = False
-            run.font.color.rgb = RGBColor(96, 68, 42)
+            run.font.color.rgb = _RGB_SUBTITLE
     if technical_shape is not None:
-        technical_shape.left = Inches(7.2)
-        technical_shape.top = Inches(1.05)
-        technical_shape.width = Inches(5.9)
-        technical_shape.height = Inches(6.2)
+        _set_bbox(technical_shape, _COD_BODY_BOX)
 
     def _style_cod_pipeline_table(table) -> None:
-        import lxml.etree as etree
-
-        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-        border_color = '2A2A2A'
         header_bg_color = '0F70B7'
         body_bg_color = 'D9D9D9'
         cod_col_bg_color = 'FFFFFF'
         subtotal_bg_color = 'D9D9D9'
         total_bg_color = 'FFF200'
 
-        def set_cell_border(cell_element, width: int = 9000):
-            tc_pr = cell_element.find('./a:tcPr', namespaces=ns)
-            if tc_pr is None:
-                tc_pr = etree.SubElement(cell_element, '{%s}tcPr' % ns['a'])
-            tc_borders = tc_pr.find('./a:tcBorders', namespaces=ns)
-            if tc_borders is None:
-                tc_borders = etree.SubElement(tc_pr, '{%s}tcBorders' % ns['a'])
-            for side in ['top', 'left', 'bottom', 'right']:
-                border = tc_borders.find('./a:%s' % side, namespaces=ns)
-                if border is None:
-                    border = etree.SubElement(tc_borders, '{%s}%s' % (ns['a'], side))
-                border.set('val', 'single')
-                border.set('w', str(width))
-                border.set('color', border_color)
-
-        def set_cell_fill(cell_element, fill_color: str):
-            tc_pr = cell_element.find('./a:tcPr', namespaces=ns)
-            if tc_pr is None:
-                tc_pr = etree.SubElement(cell_element, '{%s}tcPr' % ns['a'])
-            for existing in tc_pr.findall('./a:solidFill', namespaces=ns):
-                tc_pr.remove(existing)
-            solid_fill = etree.SubElement(tc_pr, '{%s}solidFill' % ns['a'])
-            srgb_clr = etree.SubElement(solid_fill, '{%s}srgbClr' % ns['a'])
-            srgb_clr.set('val', fill_color)
-
-        total_width = int(Inches(6.8))
-        col_count = len(table.columns)
-        if col_count == 7:
-            ratios = [0.10, 0.09, 0.06, 0.30, 0.17, 0.13, 0.15]
-        elif col_count == 8:
-            ratios = [0.08, 0.08, 0.06, 0.28, 0.14, 0.12, 0.12, 0.12]
-        else:
-            ratios = [1 / max(1, col_count)] * col_count
-        for cidx, ratio in enumerate(ratios[:col_count]):
-            table.columns[cidx].width = int(total_width * ratio)
+        grid_cols = table._tbl.tblGrid.findall(qn('a:gridCol'))
+        col_count = len(grid_cols)
+        widths = _COD_COL_WIDTHS.get(col_count)
+        if widths is None:
+            widths = (int(int(_COD_TABLE_BOX[2]) * (1 / max(1, col_count))),) * col_count
+        for grid_col, width in zip(grid_cols, widths):
+            grid_col.set('w', str(width))
+        # column.width setter가 하던 graphicFrame 너비 동기화를 한 번만 수행
+        table._graphic_frame.width = sum(int(grid_col.get('w', 0)) for grid_col in grid_cols)
 
         total_height = sum(int(row.height) for row in table.rows)
         if total_height > 0 and len(table.rows) > 1:
@@ -454,53 +606,46 @@ def apply_cod_pipeline_slide(pptx_path: Path,
                 p = tf_h.paragraphs[0]
                 p.alignment = PP_ALIGN.CENTER
                 p.line_spacing = 1.0
-                if p.runs:
-                    for run in p.runs:
-                        run.font.bold = True
-                        run.font.size = Pt(9)
-                        run.font.color.rgb = RGBColor(255, 255, 255)
-            set_cell_fill(cell._tc, header_bg_color)
-            set_cell_border(cell._tc)
+                for r in _first_paragraph_runs(cell._tc):
+                    _set_run_style(r, size=9, bold=True, rgb='FFFFFF')
+            _apply_tc_pr(cell._tc, header_bg_color)
 
+        # 라벨/No. 컬럼 텍스트를 XML에서 한 번에 읽어 소계/합계 행과 번호 행을 미리 판별
         label_col_idx = 3 if col_count >= 4 else max(0, col_count - 1)
-        subtotal_rows: list[int] = []
-        total_row_idx = None
-        for ridx in range(1, len(table.rows)):
-            label = (table.cell(ridx, label_col_idx).text or '').strip().lower().replace(' ', '')
-            if label == 'subtotal':
-                subtotal_rows.append(ridx)
-            if label == 'total':
-                total_row_idx = ridx
+        row_tcs = [tr.findall(qn('a:tc')) for tr in table._tbl.findall(qn('a:tr'))]
+        labels = [_tc_text(tcs[label_col_idx]).strip().lower().replace(' ', '') for tcs in row_tcs]
+        subtotal_rows = [ridx for ridx in range(1, len(row_tcs)) if labels[ridx] == 'subtotal']
+        total_row_idx = next((ridx for ridx in range(len(row_tcs) - 1, 0, -1) if labels[ridx] == 'total'), None)
+        numbered_rows = [_tc_text(tcs[2]).strip().isdigit() for tcs in row_tcs]
+
+        # 행마다 변하지 않는 컬럼별 정렬/배경색을 루프 밖에서 한 번만 계산
+        center_cols = {0, 1, 2}
+        cod_cols: set[int] = set()
+        if col_count == 7:
+            center_cols |= {5, 6}
+            cod_cols = {6}
+        elif col_count == 8:
+            center_cols |= {4, 5, 6, 7}
+            cod_cols = {6, 7}
+        col_alignments = [PP_ALIGN.CENTER if cidx in center_cols else PP_ALIGN.LEFT for cidx in range(col_count)]
+        plain_fills = [cod_col_bg_color if cidx in cod_cols else body_bg_color for cidx in range(col_count)]
+        numbered_fills = [
+            'FFFFFF' if 2 <= cidx <= (col_count - 1) else plain_fills[cidx]
+            for cidx in range(col_count)
+        ]
 
-            no_value = (table.cell(ridx, 2).text or '').strip()
-            is_numbered_project_row = no_value.isdigit()
+        for ridx in range(1, len(table.rows)):
+            fills = numbered_fills if numbered_rows[ridx] else plain_fills
 
-            for cidx in range(len(table.columns)):
+            for cidx in range(col_count):
                 cell = table.cell(ridx, cidx)
                 tf = cell.text_frame
                 tf.vertical_anchor = MSO_ANCHOR.MIDDLE
                 if tf.paragraphs:
-                    p = tf.paragraphs[0]
-                    center_cols = {0, 1, 2}
-                    if col_count == 7:
-                        center_cols |= {5, 6}
-                    elif col_count == 8:
-                        center_cols |= {4, 5, 6, 7}
-                    if cidx in center_cols:
-                        p.alignment = PP_ALIGN.CENTER
-                    else:
-                        p.alignment = PP_ALIGN.LEFT
-                    if p.runs:
-                        for run in p.runs:
-                            run.font.size = Pt(9)
-                            run.font.color.rgb = RGBColor(74, 57, 43)
-                if is_numbered_project_row and 2 <= cidx <= (col_count - 1):
-                    set_cell_fill(cell._tc, 'FFFFFF')
-                elif (col_count == 7 and cidx == 6) or (col_count == 8 and cidx in {6, 7}):
-                    set_cell_fill(cell._tc, cod_col_bg_color)
-                else:
-                    set_cell_fill(cell._tc, body_bg_color)
-                set_cell_border(cell._tc)
+                    tf.paragraphs[0].alignment = col_alignments[cidx]
+                    for r in _first_paragraph_runs(cell._tc):
+                        _set_run_style(r, size=9, rgb='4A392B')
+                _apply_tc_pr(cell._tc, fills[cidx])
 
         phase1_start = 1
         phase1_end = subtotal_rows[0] if subtotal_rows else (total_row_idx - 1 if total_row_idx else len(table.rows) - 1)
@@ -517,11 +662,10 @@ def apply_cod_pipeline_slide(pptx_path: Path,
             if spv_cell.text_frame.paragraphs:
                 p = spv_cell.text_frame.paragraphs[0]
                 p.alignment = PP_ALIGN.CENTER
-                if p.runs:
-                    p.runs[0].font.bold = True
-                    p.runs[0].font.size = Pt(10)
-            set_cell_fill(spv_cell._tc, '3DDC84')
-            set_cell_border(spv_cell._tc)
+                runs = _first_paragraph_runs(spv_cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=10, bold=True)
+            _apply_tc_pr(spv_cell._tc, '3DDC84')
 
         if phase1_end >= phase1_start and col_count >= 2:
 
@@ -532,11 +676,10 @@ def apply_cod_pipeline_slide(pptx_path: Path,
             if phase1_cell.text_frame.paragraphs:
                 p = phase1_cell.text_frame.paragraphs[0]
                 p.alignment = PP_ALIGN.CENTER
-                if p.runs:
-                    p.runs[0].font.bold = True
-                    p.runs[0].font.size = Pt(10)
-            set_cell_fill(phase1_cell._tc, body_bg_color)
-            set_cell_border(phase1_cell._tc)
+                runs = _first_paragraph_runs(phase1_cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=10, bold=True)
+            _apply_tc_pr(phase1_cell._tc, body_bg_color)
 
             cod_col_idx = 6 if col_count == 7 else None
             if cod_col_idx is not None and cod_col_idx < col_count:
@@ -547,9 +690,9 @@ def apply_cod_pipeline_slide(pptx_path: Path,
                 if cod1_cell.text_frame.paragraphs:
                     p = cod1_cell.text_frame.paragraphs[0]
                     p.alignment = PP_ALIGN.CENTER
-                    if p.runs:
-                        p.runs[0].font.bold = True
-                        p.runs[0].font.size = Pt(9)
+                    runs = _first_paragraph_runs(cod1_cell._tc)
+                    if runs:
+                        _set_run_style(runs[0], size=9, bold=True)
 
         if len(subtotal_rows) >= 2 and col_count >= 2:
             phase2_start = subtotal_rows[0] + 1
@@ -561,9 +704,9 @@ def apply_cod_pipeline_slide(pptx_path: Path,
             if phase2_cell.text_frame.paragraphs:
                 p = phase2_cell.text_frame.paragraphs[0]
                 p.alignment = PP_ALIGN.CENTER
-                if p.runs:
-                    p.runs[0].font.bold = True
-                    p.runs[0].font.size = Pt(10)
+                runs = _first_paragraph_runs(phase2_cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=10, bold=True)
 
             cod_col_idx = 6 if col_count == 7 else None
             if cod_col_idx is not None and cod_col_idx < col_count:
@@ -574,9 +717,9 @@ def apply_cod_pipeline_slide(pptx_path: Path,
                 if cod2_cell.text_frame.paragraphs:
                     p = cod2_cell.text_frame.paragraphs[0]
                     p.alignment = PP_ALIGN.CENTER
-                    if p.runs:
-                        p.runs[0].font.bold = True
-                        p.runs[0].font.size = Pt(9)
+                    runs = _first_paragraph_runs(cod2_cell._tc)
+                    if runs:
+                        _set_run_style(runs[0], size=9, bold=True)
 
         for ridx in subtotal_rows:
             subtotal_start = 2 if col_count >= 4 else 0
@@ -588,16 +731,15 @@ def apply_cod_pipeline_slide(pptx_path: Path,
             if subtotal_cell.text_frame.paragraphs:
                 p = subtotal_cell.text_frame.paragraphs[0]
                 p.alignment = PP_ALIGN.CENTER
-                if p.runs:
-                    p.runs[0].font.bold = True
-                    p.runs[0].font.size = Pt(10)
+                runs = _first_paragraph_runs(subtotal_cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=10, bold=True)
             for cidx in range(0, col_count):
                 cell = table.cell(ridx, cidx)
-                set_cell_fill(cell._tc, subtotal_bg_color)
-                set_cell_border(cell._tc)
-                if cell.text_frame.paragraphs and cell.text_frame.paragraphs[0].runs:
-                    cell.text_frame.paragraphs[0].runs[0].font.bold = True
-                    cell.text_frame.paragraphs[0].runs[0].font.size = Pt(10)
+                _apply_tc_pr(cell._tc, subtotal_bg_color)
+                runs = _first_paragraph_runs(cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=10, bold=True)
 
         if total_row_idx is not None and col_count >= 2:
             total_start = 1
@@ -609,54 +751,57 @@ def apply_cod_pipeline_slide(pptx_path: Path,
             if total_label_cell.text_frame.paragraphs:
                 p = total_label_cell.text_frame.paragraphs[0]
                 p.alignment = PP_ALIGN.CENTER
-                if p.runs:
-                    p.runs[0].font.bold = True
-                    p.runs[0].font.size = Pt(11)
+                runs = _first_paragraph_runs(total_label_cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=11, bold=True)
             for cidx in range(0, col_count):
                 cell = table.cell(total_row_idx, cidx)
-                set_cell_fill(cell._tc, total_bg_color)
-                set_cell_border(cell._tc)
-                if cell.text_frame.paragraphs and cell.text_frame.paragraphs[0].runs:
-                    cell.text_frame.paragraphs[0].runs[0].font.bold = True
-                    cell.text_frame.paragraphs[0].runs[0].font.size = Pt(11)
+                _apply_tc_pr(cell._tc, total_bg_color)
+                runs = _first_paragraph_runs(cell._tc)
+                if runs:
+                    _set_run_style(runs[0], size=11, bold=True)
 
         # 요청사항: 표 내 폰트 사이즈를 전부 9pt로 통일
-        for row in table.rows:
-            for cell in row.cells:
-                tf = cell.text_frame
-                for paragraph in tf.paragraphs:
-                    if paragraph.runs:
-                        for run in paragraph.runs:
-                            run.font.size = Pt(9)
+        for r in table._tbl.xpath('./a:tr/a:tc/a:txBody/a:p/a:r'):
+            _set_run_style(r, size=9)
 
     # COD Pipeline 표는 전 셀 폰트를 9pt로 통일
-    for shape in slide.shapes:
+    for shape in shape_list:
         if not getattr(shape, "has_table", False):
             continue
-        shape.left = Inches(0.2)
-        shape.top = Inches(1.05)
-        shape.width = Inches(6.8)
-        shape.height = Inches(6.0)
+        _set_bbox(shape, _COD_TABLE_BOX)
         table = getattr(shape, "table", None)
         if table is None:
             continue
         _style_cod_pipeline_table(table)
 
-    prs.save(str(pptx_path))
+    if owns_prs:
+        prs.save(str(pptx_path))
 
 
-def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_text: str, body_text: str = "") -> None:
-    """템플릿 23 기반 슬라이드의 타이틀을 강제로 적용한다."""
+def apply_equipment_procurement_title(pptx_path: Path,
+                                      slide_idx: int,
+                                      title_text: str,
+                                      body_text: str = "",
+                                      *,
+                                      prs: Any = None,
+                                      shape_list: list[Any] | None = None) -> None:
+    """템플릿 23 기반 슬라이드의 타이틀을 강제로 적용한다.
+
+    shape_list를 넘기면 slide.shapes 대신 재사용하고, 새로 추가한 텍스트박스도 그 목록에 덧붙인다.
+    """
     pptx_path = Path(pptx_path)
-    prs = Presentation(str(pptx_path))
+    prs, owns_prs = _open_presentation(pptx_path, prs)
     if slide_idx >= len(prs.slides):
         return
 
     slide = prs.slides[slide_idx]
+    if shape_list is None:
+        shape_list = list(slide.shapes)
 
     title_shape = None
     # 1) 기존 텍스트 패턴으로 우선 탐색
-    for shape in slide.shapes:
+    for shape in shape_list:
         if not getattr(shape, "has_text_frame", False):
             continue
         text = str(getattr(shape, "text", "") or "").strip()
@@ -669,10 +814,10 @@ def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_tex
     # 2) 못 찾으면 상단 텍스트 박스 중 가장 큰 것을 타이틀로 간주
     if title_shape is None:
         candidates = []
-        for shape in slide.shapes:
+        for shape in shape_list:
             if not getattr(shape, "has_text_frame", False):
                 continue
-            if getattr(shape, "top", 0) <= Inches(1.2):
+            if getattr(shape, "top", 0) <= _EQUIP_TITLE_MAX_TOP:
                 area = int(getattr(shape, "width", 0)) * int(getattr(shape, "height", 0))
                 candidates.append((area, shape))
         if candidates:
@@ -681,7 +826,8 @@ def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_tex
     if title_shape is not None:
         tf = getattr(title_shape, "text_frame", None)
         if tf is None:
-            prs.save(str(pptx_path))
+            if owns_prs:
+                prs.save(str(pptx_path))
             return
         tf.clear()
         p = tf.paragraphs[0]
@@ -689,18 +835,16 @@ def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_tex
         p.alignment = PP_ALIGN.LEFT
         if p.runs:
             run = p.runs[0]
-            run.font.size = Pt(30)
+            run.font.size = _PT30
             run.font.bold = True
-            run.font.color.rgb = RGBColor(68, 114, 196)
+            run.font.color.rgb = _RGB_TITLE
 
         # 위치도 타이틀 슬라이드들과 유사하게 정렬
-        title_shape.left = Inches(0.2)
-        title_shape.top = Inches(0.2)
-        title_shape.width = Inches(12.9)
-        title_shape.height = Inches(0.5)
+        _set_bbox(title_shape, _TITLE_BOX)
     else:
         # 타이틀 shape가 없으면 새로 생성
-        title_shape = slide.shapes.add_textbox(Inches(0.2), Inches(0.2), Inches(12.9), Inches(0.5))
+        title_shape = slide.shapes.add_textbox(*_TITLE_BOX)
+        shape_list.append(title_shape)
         tf = title_shape.text_frame
         tf.clear()
         p = tf.paragraphs[0]
@@ -708,14 +852,14 @@ def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_tex
         p.alignment = PP_ALIGN.LEFT
         if p.runs:
             run = p.runs[0]
-            run.font.size = Pt(30)
+            run.font.size = _PT30
             run.font.bold = True
-            run.font.color.rgb = RGBColor(68, 114, 196)
+            run.font.color.rgb = _RGB_TITLE
 
     # 본문 불릿도 주입 (하드코딩 문구 대신 content 사용)
     if body_text:
         body_shape = None
-        for shape in slide.shapes:
+        for shape in shape_list:
             if not getattr(shape, "has_text_frame", False):
                 continue
             text = str(getattr(shape, "text", "") or "").strip()
@@ -726,7 +870,8 @@ def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_tex
                 break
 
         if body_shape is None:
-            body_shape = slide.shapes.add_textbox(Inches(0.24), Inches(0.95), Inches(12.8), Inches(1.55))
+            body_shape = slide.shapes.add_textbox(*_EQUIP_BODY_BOX)
+            shape_list.append(body_shape)
 
         tf_body = getattr(body_shape, "text_frame", None)
         if tf_body is not None:
@@ -739,112 +884,144 @@ def apply_equipment_procurement_title(pptx_path: Path, slide_idx: int, title_tex
                 p.text = f"•  {line.lstrip('- ').strip()}"
                 p.alignment = PP_ALIGN.LEFT
                 p.line_spacing = 1.0
-                p.space_before = Pt(0)
-                p.space_after = Pt(0)
+                p.space_before = _PT0
+                p.space_after = _PT0
                 if p.runs:
                     run = p.runs[0]
-                    run.font.size = Pt(8.8)
+                    run.font.size = _PT8_8
                     run.font.bold = False
-                    run.font.color.rgb = RGBColor(0, 0, 0)
+                    run.font.color.rgb = _RGB_BLACK
+
+            _set_bbox(body_shape, _EQUIP_BODY_BOX)
+
+    if owns_prs:
+        prs.save(str(pptx_path))
+
+
+def _parse_number(value: Any) -> float:
+    """JSON 수치(int/float 또는 콤마 포함 문자열)를 float로 변환. 변환할 수 없으면 0.0."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", ""))
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+def _read_json_or_empty(path: Path) -> Any:
+    """없는 파일·빈 파일·깨진 JSON이면 {}를 반환한다. 파싱 결과는 (경로, mtime) 캐시를 공유한다."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    if not stat.st_size:
+        return {}
+    try:
+        return _load_json_cached(str(path), stat.st_mtime_ns)
+    except (OSError, ValueError):
+        return {}
 
-            body_shape.left = Inches(0.24)
-            body_shape.top = Inches(0.95)
-            body_shape.width = Inches(12.8)
-            body_shape.height = Inches(1.55)
 
-    prs.save(str(pptx_path))
+_FMT_INT = ",.0f"
+_FMT_ONE_DECIMAL = ",.1f"
+
+
+def _format_positive(value: float, spec: str = _FMT_INT) -> str:
+    """양수면 천 단위 콤마 포맷 문자열, 0 이하면 빈 문자열을 반환한다."""
+    return format(value, spec) if value > 0 else ""
+
+
+def _opex_cost(oy: dict[str, Any], key: str) -> float:
+    """opex_year1 블록에서 key 항목의 Cost 값을 float로 반환한다."""
+    block = oy.get(key)
+    if not isinstance(block, dict):
+        return 0.0
+    return _parse_number(block.get("Cost"))
 
 
 def _build_project_detail_values(data_dir: Path) -> dict[str, Any]:
+    # 클러스터 프로젝트를 한 번만 순회하며 COD/용량/opex 비용을 함께 집계한다.
     general_path = data_dir / "general.json"
     opex_path = data_dir / "opex_year1.json"
 
     def _as_dict(value: Any) -> dict[str, Any]:
         return value if isinstance(value, dict) else {}
 
-    try:
-        general = json.loads(general_path.read_text(encoding="utf-8"))
-    except Exception:
-        general = {}
-    try:
-        opex = json.loads(opex_path.read_text(encoding="utf-8"))
-    except Exception:
-        opex = {}
-
-    vendor_path = data_dir / "equipment_vendors.json"
-    try:
-        vendor_overrides = json.loads(vendor_path.read_text(encoding="utf-8"))
-    except Exception:
-        vendor_overrides = {}
+    general = _read_json_or_empty(general_path)
+    opex = _read_json_or_empty(opex_path)
+    vendor_overrides = _read_json_or_empty(data_dir / "equipment_vendors.json")
 
     projects = general.get("projects") if isinstance(general, dict) else []
     if not isinstance(projects, list):
         projects = []
     cluster_projects = [p for p in projects[:4] if isinstance(p, dict)]
 
+    opex_projects = opex.get("projects") if isinstance(opex, dict) else []
+    if not isinstance(opex_projects, list):
+        opex_projects = []
+    # 이름별 opex 프로젝트를 한 번만 묶어 두고 클러스터 프로젝트 이름으로 바로 조회
+    opex_by_name: dict[str, list[dict[str, Any]]] = {}
+    for p in opex_projects:
+        if isinstance(p, dict):
+            opex_by_name.setdefault(str(p.get("name") or "").strip(), []).append(p)
+
     regions: list[str] = []
-    cod_dates: list[datetime] = []
+    min_cod: datetime | None = None
     dc_wp = 0.0
+    # quote/budget from opex costs for first 4 projects
+    quote = 0.0
+    contingency = 0.0
+    grid_connection_total = 0.0
     names: set[str] = set()
     for p in cluster_projects:
-        names.add(str(p.get("name") or "").strip())
+        name = str(p.get("name") or "").strip()
+        if name not in names:
+            names.add(name)
+            for op in opex_by_name.get(name, ()):
+                oy = _as_dict(op.get("opex_year1"))
+                grid_cost = _opex_cost(oy, "Grid Connection Cost")
+                quote += _opex_cost(oy, "Modules") + _opex_cost(oy, "BOS") + grid_cost
+                grid_connection_total += grid_cost
+                contingency += _opex_cost(oy, "Contingency")
         gi = _as_dict(p.get("general_inputs"))
         region = str(gi.get("Region") or p.get("region") or "").strip()
         if region and region not in regions:
             regions.append(region)
-        cap_mw = gi.get("Total Capacity DC")
-        try:
-            dc_wp += float(str(cap_mw).replace(",", "")) * 1000
-        except Exception:
-            pass
+        dc_wp += _parse_number(gi.get("Total Capacity DC")) * 1000
         cod_raw = gi.get("COD date")
         if cod_raw:
-            txt = str(cod_raw).strip().replace(" ", "T")
-            try:
-                cod_dates.append(datetime.fromisoformat(txt))
-            except Exception:
+            dt: datetime | None = None
+            m = _COD_DATE_RE.match(str(cod_raw))
+            if m:
                 try:
-                    cod_dates.append(datetime.strptime(txt.split("T")[0], "%Y-%m-%d"))
-                except Exception:
+                    dt = datetime(int(m[1]), int(m[2]), int(m[3]))
+                except ValueError:
                     pass
+            if dt is None:
+                txt = str(cod_raw).strip().replace(" ", "T")
+                try:
+                    dt = datetime.fromisoformat(txt)
+                except Exception:
+                    try:
+                        dt = datetime.strptime(txt.split("T")[0], "%Y-%m-%d")
+                    except Exception:
+                        pass
+            if dt is not None and (min_cod is None or dt < min_cod):
+                min_cod = dt
 
     # 요청사항: LOCATION 값은 고정 문구 사용
     location_text = "see the LOCATION"
-    if cod_dates:
-        min_cod = min(cod_dates)
+    if min_cod is not None:
         quarter = ((min_cod.month - 1) // 3) + 1
         cod_text = f"Q{quarter} {str(min_cod.year)[-2:]}"
     else:
         cod_text = "TBD"
 
-    # quote/budget from opex costs for first 4 projects
-    quote = 0.0
-    contingency = 0.0
-    grid_connection_total = 0.0
-    opex_projects = opex.get("projects") if isinstance(opex, dict) else []
-    if not isinstance(opex_projects, list):
-        opex_projects = []
-    for p in opex_projects:
-        if not isinstance(p, dict):
-            continue
-        if str(p.get("name") or "").strip() not in names:
-            continue
-        oy = _as_dict(p.get("opex_year1"))
-        def _cost(key: str) -> float:
-            block = _as_dict(oy.get(key))
-            if block:
-                try:
-                    return float(str(block.get("Cost") or "0").replace(",", ""))
-                except Exception:
-                    return 0.0
-            return 0.0
-        grid_cost = _cost("Grid Connection Cost")
-        quote += _cost("Modules") + _cost("BOS") + grid_cost
-        grid_connection_total += grid_cost
-        contingency += _cost("Contingency")
-
     budget = quote + contingency
     delta = budget - quote
+    # dc_wp는 MWp × 1000 = kWp 단위이므로 Wp로 환산하려면 1000을 한 번 더 곱한다
     total_wp = dc_wp * 1000.0
     cubicle_won_per_wp = (grid_connection_total / total_wp) if total_wp > 0 else 0.0
     cubicle_amount_for_1000kwp = cubicle_won_per_wp * 1_000_000
@@ -864,41 +1041,65 @@ def _build_project_detail_values(data_dir: Path) -> dict[str, Any]:
     return {
         "location": location_text,
         "cod": cod_text,
-        "dc_wp": f"{dc_wp:,.0f}" if dc_wp > 0 else "",
-        "total_quote": f"{quote:,.0f}" if quote > 0 else "",
-        "equip_budget": f"{budget:,.0f}" if budget > 0 else "",
-        "delta": f"{delta:,.0f}" if delta > 0 else "",
-        "cubicle_amount": f"{cubicle_amount_for_1000kwp:,.0f}" if cubicle_amount_for_1000kwp > 0 else "",
-        "cubicle_won_per_wp": f"{cubicle_won_per_wp:,.1f}" if cubicle_won_per_wp > 0 else "",
+        "dc_wp": _format_positive(dc_wp),
+        "total_quote": _format_positive(quote),
+        "equip_budget": _format_positive(budget),
+        "delta": _format_positive(delta),
+        "cubicle_amount": _format_positive(cubicle_amount_for_1000kwp),
+        "cubicle_won_per_wp": _format_positive(cubicle_won_per_wp, _FMT_ONE_DECIMAL),
         "cubicle_companies": cubicle_companies,
     }
 
 
-def apply_equipment_project_detail_values(pptx_path: Path, slide_idx: int, data_dir: Path) -> None:
+def _first_in_range(entries: list[tuple[int, int, int, Any]], lo: int, hi: int, *, by_top: bool = False) -> Any | None:
+    """center_x로 정렬된 (center_x, top, 순서, shape) 중 lo <= center_x <= hi인 첫 shape를 반환한다.
+
+    by_top이면 top이 가장 작은 것(동률이면 슬라이드 순서), 아니면 슬라이드 순서상 첫 번째를 고른다.
+    """
+    best = None
+    best_rank = None
+    for idx in range(bisect_left(entries, (lo,)), len(entries)):
+        center_x, top, order, shape = entries[idx]
+        if center_x > hi:
+            break
+        rank = (top, order) if by_top else (order,)
+        if best_rank is None or rank < best_rank:
+            best, best_rank = shape, rank
+    return best
+
+
+def apply_equipment_project_detail_values(pptx_path: Path,
+                                          slide_idx: int,
+                                          data_dir: Path,
+                                          *,
+                                          prs: Any = None,
+                                          shape_list: list[Any] | None = None) -> None:
     """슬라이드 14 좌측 PROJECT DETAIL 영역 값(수치)을 data/*.json 기반으로 주입."""
     values = _build_project_detail_values(data_dir)
 
     pptx_path = Path(pptx_path)
-    prs = Presentation(str(pptx_path))
+    prs, owns_prs = _open_presentation(pptx_path, prs)
     if slide_idx >= len(prs.slides):
         return
     slide = prs.slides[slide_idx]
 
     label_shapes: dict[str, Any] = {}
-    budget_shapes: list[Any] = []
-    amount_header_shapes: list[Any] = []
-    won_header_shapes: list[Any] = []
-    company_header_shapes: list[Any] = []
+    # 헤더/Budget 셀은 (center_x, top, 순서, shape)로 모아 center_x 기준 정렬 후 구간 탐색
+    budget_shapes: list[tuple[int, int, int, Any]] = []
+    amount_header_shapes: list[tuple[int, int, int, Any]] = []
+    won_header_shapes: list[tuple[int, int, int, Any]] = []
+    company_header_shapes: list[tuple[int, int, int, Any]] = []
     cubicle_header_shape = None
     location_shape = None
     cod_shape = None
     cluster_shape = None
 
-    for shape in slide.shapes:
-        if not getattr(shape, "has_text_frame", False):
+    snapshot = _snapshot_shapes(slide, shape_list)
+    for order, (shape, has_tf, text, left, top, width, _height) in enumerate(snapshot):
+        if not has_tf:
             continue
-        text = str(getattr(shape, "text", "") or "").strip()
-        norm = text.lower().replace(" ", "")
+        text_lower = text.lower()
+        norm = text_lower.replace(" ", "")
         if norm == "location":
             label_shapes["location"] = shape
         elif norm == "cod":
@@ -909,27 +1110,33 @@ def apply_equipment_project_detail_values(pptx_path: Path, slide_idx: int, data_
             label_shapes["total_quote"] = shape
         elif "equip.budget" in norm:
             label_shapes["equip_budget"] = shape
-        elif norm in {"δ+", "d+", "a+", "△+", "Δ+".lower()} or "δ+" in norm or "Δ+" in text:
+        elif norm in _DELTA_LABELS or "δ+" in norm:
             label_shapes["delta"] = shape
-        elif "see the location" in text.lower():
+        elif "see the location" in text_lower:
             location_shape = shape
-        elif text.lower().startswith("q") and len(text) <= 6:
+        elif text_lower.startswith("q") and len(text) <= 6:
             cod_shape = shape
-        elif "cluster set" in text.lower():
+        elif "cluster set" in text_lower:
             cluster_shape = shape
-        elif text.strip() == "Budget":
-            budget_shapes.append(shape)
-        elif text.strip() == "Amount(\\)":
-            amount_header_shapes.append(shape)
-        elif text.strip() == "Won(\\)/wp":
-            won_header_shapes.append(shape)
-        elif text.strip() == "Company":
-            company_header_shapes.append(shape)
-
-        if "CUBICLE [1200kVA]" in text and "PV MONITORING" in text:
+        elif text == "Budget":
+            budget_shapes.append((int(left + (width / 2)), top, order, shape))
+        elif text == "Amount(\\)":
+            amount_header_shapes.append((int(left + (width / 2)), top, order, shape))
+        elif text == "Won(\\)/wp":
+            won_header_shapes.append((int(left + (width / 2)), top, order, shape))
+        elif text == "Company":
+            company_header_shapes.append((int(left + (width / 2)), top, order, shape))
+
+        if _CUBICLE_MARK in text and _PV_MONITORING_MARK in text:
             cubicle_header_shape = shape
 
-    def _set_shape_text(shape: Any, value: str, size: float = 9.0):
+    for entries in (budget_shapes, amount_header_shapes, won_header_shapes, company_header_shapes):
+        entries.sort()
+
+    def _track(shape: Any, text: str, left: int, top: int, width: int, height: int) -> None:
+        snapshot.append((shape, True, text.strip(), int(left), int(top), int(width), int(height)))
+
+    def _set_shape_text(shape: Any, value: str, size: int = _PT9):
         tf = getattr(shape, "text_frame", None)
         if tf is None:
             return
@@ -940,9 +1147,9 @@ def apply_equipment_project_detail_values(pptx_path: Path, slide_idx: int, data_
         p.alignment = PP_ALIGN.CENTER
         if p.runs:
             run = p.runs[0]
-            run.font.size = Pt(size)
+            run.font.size = size
             run.font.bold = False
-            run.font.color.rgb = RGBColor(0, 0, 0)
+            run.font.color.rgb = _RGB_BLACK
 
     if location_shape is not None:
         _set_shape_text(location_shape, values["location"])
@@ -951,6 +1158,9 @@ def apply_equipment_project_detail_values(pptx_path: Path, slide_idx: int, data_
     if cluster_shape is not None:
         _set_shape_text(cluster_shape, "CLUSTER SET 1 ~ 4")
 
+    # 추가할 값 텍스트박스 (left, top, width, height, text, size): 모아서 한 번에 삽입
+    textbox_specs: list[tuple[int, int, int, int, str, int]] = []
+
     # LOCATION/COD는 기본 값 shape가 없을 때만 라벨 우측 값 칸 생성
     for key in ["location", "cod"]:
         if key == "location" and location_shape is not None:
@@ -960,132 +1170,109 @@ def apply_equipment_project_detail_values(pptx_path: Path, slide_idx: int, data_
         label = label_shapes.get(key)
         if label is None:
             continue
-        left = label.left + label.width + Inches(0.02)
+        left = label.left + label.width + _DETAIL_VALUE_GAP
         top = label.top
-        width = Inches(1.9)
+        width = _DETAIL_TEXT_WIDTH
         height = label.height
-        val_shape = slide.shapes.add_textbox(left, top, width, height)
-        _set_shape_text(val_shape, values[key], 9.0)
+        textbox_specs.append((left, top, width, height, values[key], _PT9))
 
     # Numeric rows often have empty value boxes; place overlay text right to each label
     for key in ["dc_wp", "total_quote", "equip_budget", "delta"]:
         label = label_shapes.get(key)
         if label is None:
             continue
-        left = label.left + label.width + Inches(0.02)
+        left = label.left + label.width + _DETAIL_VALUE_GAP
         top = label.top
-        width = Inches(1.35)
+        width = _DETAIL_NUMBER_WIDTH
         height = label.height
-        val_shape = slide.shapes.add_textbox(left, top, width, height)
-        _set_shape_text(val_shape, values[key], 9.0)
+        textbox_specs.append((left, top, width, height, values[key], _PT9))
 
     # CUBICLE [1200kVA]+'DER-AVM'+PV MONITORING budget row values (data-driven)
+    cubicle_company_header = None
     if cubicle_header_shape is not None:
         cubicle_left = cubicle_header_shape.left
         cubicle_right = cubicle_header_shape.left + cubicle_header_shape.width
 
-        def _center_x(shape: Any) -> int:
-            return int(shape.left + (shape.width / 2))
-
-        cubicle_budget = next(
-            (
-                shp
-                for shp in sorted(budget_shapes, key=lambda s: s.top)
-                if cubicle_left <= _center_x(shp) <= cubicle_right
-            ),
-            None,
-        )
-        cubicle_amount_header = next(
-            (
-                shp
-                for shp in amount_header_shapes
-                if cubicle_left <= _center_x(shp) <= cubicle_right
-            ),
-            None,
-        )
-        cubicle_won_header = next(
-            (
-                shp
-                for shp in won_header_shapes
-                if cubicle_left <= _center_x(shp) <= cubicle_right
-            ),
-            None,
-        )
-        cubicle_company_header = next(
-            (
-                shp
-                for shp in company_header_shapes
-                if cubicle_left <= _center_x(shp) <= cubicle_right
-            ),
-            None,
-        )
+        cubicle_budget = _first_in_range(budget_shapes, cubicle_left, cubicle_right, by_top=True)
+        cubicle_amount_header = _first_in_range(amount_header_shapes, cubicle_left, cubicle_right)
+        cubicle_won_header = _first_in_range(won_header_shapes, cubicle_left, cubicle_right)
+        cubicle_company_header = _first_in_range(company_header_shapes, cubicle_left, cubicle_right)
 
         if cubicle_budget is not None:
             amount_text = values.get("cubicle_amount", "")
             won_text = values.get("cubicle_won_per_wp", "")
 
             if cubicle_amount_header is not None and amount_text:
-                amount_shape = slide.shapes.add_textbox(
+                textbox_specs.append((
                     cubicle_amount_header.left,
                     cubicle_budget.top,
                     cubicle_amount_header.width,
                     cubicle_budget.height,
-                )
-                _set_shape_text(amount_shape, amount_text, 9.0)
+                    amount_text,
+                    _PT9,
+                ))
 
             if cubicle_won_header is not None and won_text:
-                won_shape = slide.shapes.add_textbox(
+                textbox_specs.append((
                     cubicle_won_header.left,
                     cubicle_budget.top,
                     cubicle_won_header.width,
                     cubicle_budget.height,
-                )
-                _set_shape_text(won_shape, won_text, 9.0)
-
+                    won_text,
+                    _PT9,
+                ))
+
+    if textbox_specs:
+        new_shapes = _add_textboxes(slide, [spec[:4] for spec in textbox_specs])
+        if shape_list is not None:
+            shape_list.extend(new_shapes)
+        for val_shape, (left, top, width, height, text, size) in zip(new_shapes, textbox_specs):
+            _set_shape_text(val_shape, text, size)
+            _track(val_shape, text, left, top, width, height)
+
+    if cubicle_company_header is not None:
         company_values = values.get("cubicle_companies")
-        if cubicle_company_header is not None and isinstance(company_values, list) and company_values:
-            min_top = cubicle_company_header.top + int(Inches(0.10))
-            max_top = cubicle_company_header.top + int(Inches(0.80))
+        if isinstance(company_values, list) and company_values:
+            min_top = cubicle_company_header.top + _CUBICLE_COMPANY_MIN_OFFSET
+            max_top = cubicle_company_header.top + _CUBICLE_COMPANY_MAX_OFFSET
             skip_texts = {"Budget", "Amount(\\)", "Won(\\)/wp", "Company"}
             cubicle_company_cells = [
-                shp
-                for shp in slide.shapes
-                if getattr(shp, "has_text_frame", False)
-                and cubicle_left <= _center_x(shp) <= cubicle_right
-                and min_top <= shp.top <= max_top
-                and str(getattr(shp, "text", "") or "").strip() not in skip_texts
+                (top, shp)
+                for shp, has_tf, text, left, top, width, _height in snapshot
+                if has_tf
+                and cubicle_left <= int(left + (width / 2)) <= cubicle_right
+                and min_top <= top <= max_top
+                and text not in skip_texts
             ]
-            cubicle_company_cells.sort(key=lambda s: s.top)
+            cubicle_company_cells.sort(key=lambda item: item[0])
 
             for idx, name in enumerate(company_values):
                 if idx >= len(cubicle_company_cells):
                     break
-                _set_shape_text(cubicle_company_cells[idx], str(name), 8.0)
+                _set_shape_text(cubicle_company_cells[idx][1], str(name), _PT8)
 
     # 요청사항: 슬라이드 14 표 영역 폰트 크기 6pt
-    table_top_threshold = Inches(2.55)
-    for shape in slide.shapes:
-        if not getattr(shape, "has_text_frame", False):
-            continue
-        if getattr(shape, "top", 0) < table_top_threshold:
-            continue
-        tf = getattr(shape, "text_frame", None)
-        if tf is None:
+    for shape, has_tf, _text, _left, top, _width, _height in snapshot:
+        if not has_tf or top < _DETAIL_TABLE_TOP:
             continue
-        for p in tf.paragraphs:
-            for run in p.runs:
-                run.font.size = Pt(6)
-                run.font.bold = False
-                run.font.color.rgb = RGBColor(0, 0, 0)
+        # 이미 6pt/보통/검정인 run은 _set_run_style이 XML을 건드리지 않는다
+        for r in shape.text_frame._txBody.xpath("./a:p/a:r"):
+            _set_run_style(r, size=6, bold=False, rgb="000000")
 
-    prs.save(str(pptx_path))
+    if owns_prs:
+        prs.save(str(pptx_path))
+
+
+# 기본 data/출력 경로는 import 시 한 번만 resolve (호출마다 stat 하지 않도록)
+_DEFAULT_DATA_DIR = (current_dir.parent / "data").resolve()
+_DEFAULT_OUTPUT_DIR = (current_dir.parent / "resuot_output").resolve()
 
 
 def _resolve_capex_data_dir() -> Path:
     env_data_dir = os.getenv("CAPEX_DATA_DIR", "").strip()
     if env_data_dir:
         return Path(env_data_dir).resolve()
-    return (Path(__file__).resolve().parent.parent / "data").resolve()
+    return _DEFAULT_DATA_DIR
 
 
 def _resolve_capex_output_path(default_output_dir: Path) -> Path:
@@ -1093,7 +1280,7 @@ def _resolve_capex_output_path(default_output_dir: Path) -> Path:
     if env_output_path:
         return Path(env_output_path).resolve()
     env_output_dir = os.getenv("CAPEX_OUTPUT_DIR", "").strip()
-    output_dir = Path(env_output_dir).resolve() if env_output_dir else default_output_dir.resolve()
+    output_dir = Path(env_output_dir).resolve() if env_output_dir else default_output_dir
     return output_dir / "result.pptx"
 
 
@@ -1105,7 +1292,7 @@ def test_airun_pptx():
 
     # 출력 디렉토리 생성 (workspace 내 고정)
     data_dir = _resolve_capex_data_dir()
-    output_dir = Path(__file__).resolve().parent.parent / "resuot_output"
+    output_dir = _DEFAULT_OUTPUT_DIR
     output_path = _resolve_capex_output_path(output_dir)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -1118,6 +1305,9 @@ def test_airun_pptx():
     gen = PPTXGenerator(aspect_ratio='16_9', template_type='custom')
     gen.generate_with_template(content_list, str(output_path))
 
+    # 후처리는 한 번 연 Presentation에 모두 적용하고 마지막에 한 번만 저장
+    prs = Presentation(str(output_path))
+
     approval_values = _build_capex_approval_values(data_dir)
     _apply_approval_request_replacements(
         output_path,
@@ -1126,6 +1316,7 @@ def test_airun_pptx():
             "EUR 3,459,727": approval_values["capex_eur_text"],
             "4.203MWp": approval_values["capacity_text"],
         },
+        prs=prs,
     )
 
     # 세션 타이틀 슬라이드 재구성 (content 적용 보장)
@@ -1141,20 +1332,17 @@ def test_airun_pptx():
                 return None
         return None
 
+    # 정렬 키를 튜플에 미리 담아 key 함수 없이 정렬 (order 없는 항목은 원래 순서로 뒤에 배치)
     ordered = []
     for idx, item in enumerate(content_list):
         norm = _normalized_order(item.order)
-        ordered.append((idx, item, norm))
-
-    ordered_content = [
-        item for _, item, _ in sorted(
-            ordered,
-            key=lambda x: (
-                0 if x[2] is not None else 1,
-                x[2] if x[2] is not None else x[0]
-            )
-        )
-    ]
+        if norm is None:
+            ordered.append((1, idx, idx, item))
+        else:
+            ordered.append((0, norm, idx, item))
+    ordered.sort()
+
+    ordered_content = [item for *_, item in ordered]
 
     for idx, c in enumerate(ordered_content):
         # 템플릿 스타일 유지를 위해 대부분 레이아웃은 generate_with_template 결과를 그대로 사용.
@@ -1178,6 +1366,7 @@ def test_airun_pptx():
                 technical_solution_text,
                 table_title_1,
                 "Technical Solution",
+                prs=prs,
             )
 
         if c.layout == "cod_pipeline_phase":
@@ -1189,6 +1378,7 @@ def test_airun_pptx():
                 c.content or "",
                 table_title_1,
                 "Construction Notes",
+                prs=prs,
             )
 
         if c.layout == "main_agreements":
@@ -1198,23 +1388,31 @@ def test_airun_pptx():
                 c.title,
                 c.table_headers or [],
                 c.table_data or [],
+                prs=prs,
             )
 
         if c.layout == "equipment_procurement_case":
+            # 같은 슬라이드를 두 후처리가 연달아 다루므로 shape wrapper 목록을 한 번만 만들어 공유
+            shape_list = list(prs.slides[idx].shapes) if idx < len(prs.slides) else None
             apply_equipment_procurement_title(
                 output_path,
                 idx,
                 c.title,
                 c.content or "",
+                prs=prs,
+                shape_list=shape_list,
             )
             apply_equipment_project_detail_values(
                 output_path,
                 idx,
                 data_dir,
+                prs=prs,
+                shape_list=shape_list,
             )
 
     # 템플릿 기본 슬라이드가 남지 않도록 생성된 슬라이드를 content_list 길이에 맞춰 정리
-    prune_slides(output_path, keep=len(content_list))
+    prune_slides(output_path, keep=len(content_list), prs=prs)
+    prs.save(str(output_path))
 
     # title 위치/스타일은 각 레이아웃 템플릿 기준으로 재적용한다.
     # (1페이지 표지, session_title 레이아웃은 제외)
@@ -1226,18 +1424,17 @@ def test_airun_pptx():
     print(f"   저장 폴더: {output_path.parent}")
     print(f"   총 슬라이드: {len(content_list)}")
 
-    # 로고 확인
-    from pptx import Presentation
-    prs = Presentation(str(output_path))
-    logo_count = 0
-    for i, slide in enumerate(prs.slides):
-        for shape in slide.shapes:
-            if shape.shape_type == 13:  # PICTURE
-                left_inch = float(shape.left) / 914400
-                if left_inch > 10:  # 오른쪽 상단 로고
-                    logo_count += 1
-
-    print(f"   로고 포함: {logo_count}개 슬라이드")
+    # 로고 확인: 전체 shape 순회가 필요하므로 CAPEX_VERBOSE 설정 시에만 수행 (저장한 Presentation 재사용)
+    if os.getenv("CAPEX_VERBOSE", "").strip():
+        logo_count = 0
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                if shape.shape_type == 13:  # PICTURE
+                    left_inch = float(shape.left) / 914400
+                    if left_inch > 10:  # 오른쪽 상단 로고
+                        logo_count += 1
+
+        print(f"   로고 포함: {logo_count}개 슬라이드")
 
     # 레이아웃 요약
     print("\n" + "=" * 80)
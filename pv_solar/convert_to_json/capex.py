@@ -3,18 +3,21 @@
 
 import argparse
 import json
-import re
 import datetime
 import sys
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, Tuple, Optional, List
 
 import openpyxl
-from openpyxl.utils.cell import get_column_letter, column_index_from_string
 
-PROJECT_RE = re.compile(r"^Project\s*\d+\s*$", re.IGNORECASE)
+try:
+    from sheet_grid import SheetGrid, read_column_dimensions
+except ModuleNotFoundError:
+    from pv_solar.convert_to_json.sheet_grid import SheetGrid, read_column_dimensions
 
-CAPEX_FIELD_LABELS = {
+
+CAPEX_FIELD_LABELS = frozenset({
     "currency",
     "cost",
     "indexed?",
@@ -23,15 +26,32 @@ CAPEX_FIELD_LABELS = {
     "monthly distribution",
     "comments",
     "unit",
-}
+})
 
 EXCEL_ZERO_DATE = datetime.date(1899, 12, 30)
 
+# Indexed? 문자열 값(소문자) -> 정규화 값
+INDEXED_VALUE_MAP = {
+    "yes": "Yes",
+    "y": "Yes",
+    "true": "Yes",
+    "1": "Yes",
+    "no": "No",
+    "n": "No",
+    "false": "No",
+    "0": "No",
+}
+
 
 # -----------------------------
 # Utils
 # -----------------------------
 
+def is_project_label(s: str) -> bool:
+    """strip된 문자열이 'Project <숫자>' 형태인지 (대소문자 무시, 사이 공백 허용)."""
+    return s[:7].lower() == "project" and s[7:].lstrip().isdecimal()
+
+
 def norm_text(v: Any) -> Optional[str]:
     if not isinstance(v, str):
         return None
@@ -63,6 +83,19 @@ def to_json_value(v: Any) -> Any:
     return v
 
 
+def lower_labels(ws, col: int, last_row: int) -> List[Optional[str]]:
+    """col 열 1..last_row의 라벨을 strip().lower()로 한 번만 정규화 (인덱스는 행 번호, 빈 값은 None)."""
+    out: List[Optional[str]] = [None]
+    for row in ws.rows[1:last_row + 1]:
+        v = row[col]
+        if isinstance(v, str):
+            s = v.strip()
+            out.append(s.lower() if s else None)
+        else:
+            out.append(None)
+    return out
+
+
 def blank_if_empty(v: Any) -> Any:
     if v is None:
         return ""
@@ -74,6 +107,21 @@ def blank_if_empty(v: Any) -> Any:
     return v
 
 
+def json_or_blank(v: Any) -> Any:
+    """blank_if_empty(to_json_value(v))와 같은 결과. 흔한 str/None/숫자는 정확한 타입 비교 한 번으로 처리."""
+    t = type(v)
+    if t is str:
+        s = v.strip()
+        return "" if s == "" or s == "-" else s
+    if v is None:
+        return ""
+    if t is float:
+        return int(v) if v.is_integer() else v
+    if t is int:
+        return v
+    return blank_if_empty(to_json_value(v))
+
+
 def normalize_indexed_value(v: Any) -> str:
     """
     Indexed? 값 정규화:
@@ -86,17 +134,9 @@ def normalize_indexed_value(v: Any) -> str:
     if v == "":
         return ""
 
+    # blank_if_empty가 이미 strip한 문자열
     if isinstance(v, str):
-        s = v.strip().lower()
-        if s in ("yes", "y", "true"):
-            return "Yes"
-        if s in ("no", "n", "false"):
-            return "No"
-        if s == "1":
-            return "Yes"
-        if s == "0":
-            return "No"
-        return v.strip()
+        return INDEXED_VALUE_MAP.get(v.lower(), v)
 
     if isinstance(v, bool):
         return "Yes" if v else "No"
@@ -110,24 +150,14 @@ def normalize_indexed_value(v: Any) -> str:
     return str(v)
 
 
-def is_column_visible(ws, col_idx: int) -> bool:
-    letter = get_column_letter(col_idx)
-    dim = ws.column_dimensions.get(letter)
-    if dim is None:
-        return True
-
-    if getattr(dim, "hidden", False):
-        return False
+class CapexSheetGrid(SheetGrid):
+    """SheetGrid + find_project_header_row_visible 결과 캐시 (scan_max_rows -> 결과)."""
 
-    width = getattr(dim, "width", None)
-    if width is not None:
-        try:
-            if float(width) == 0.0:
-                return False
-        except Exception:
-            pass
+    __slots__ = ("project_headers",)
 
-    return True
+    def __init__(self, ws, column_dimensions: Dict[int, Dict[str, str]]) -> None:
+        super().__init__(ws, column_dimensions)
+        self.project_headers: Dict[int, Optional[Tuple[int, Dict[int, str]]]] = {}
 
 
 # -----------------------------
@@ -141,19 +171,35 @@ def find_project_header_row_visible(
     """
     ws 내에서 Project 1..n이 존재하는 행을 찾아,
     '보이는 열'만 col_idx -> "Project n" 형태로 반환.
+    시트별로 한 번만 스캔하고 이후 호출은 캐시된 결과를 사용.
     """
+    if scan_max_rows not in ws.project_headers:
+        ws.project_headers[scan_max_rows] = scan_project_header_row(ws, scan_max_rows)
+
+    found = ws.project_headers[scan_max_rows]
+    if found is None:
+        raise RuntimeError("Project 헤더 행(Project 1, Project 2, ...)을 찾지 못했습니다.")
+
+    header_row, cols = found
+    return header_row, dict(cols)
+
+
+def scan_project_header_row(ws, scan_max_rows: int) -> Optional[Tuple[int, Dict[int, str]]]:
     best_row: Optional[int] = None
     best_visible: Dict[int, str] = {}
 
+    visible = ws.visible
     max_rows = min(ws.max_row, scan_max_rows)
     for r in range(1, max_rows + 1):
         row_visible: Dict[int, str] = {}
+        row = ws.rows[r]
 
-        for c in range(1, ws.max_column + 1):
-            v = ws.cell(r, c).value
-            if isinstance(v, str) and PROJECT_RE.match(v.strip()):
-                if is_column_visible(ws, c):
-                    row_visible[c] = v.strip()
+        for c, v in enumerate(row):
+            if not isinstance(v, str):
+                continue
+            sv = v.strip()
+            if visible[c] and is_project_label(sv):
+                row_visible[c] = sv
 
         if row_visible:
             if best_row is None or len(row_visible) > len(best_visible):
@@ -161,7 +207,7 @@ def find_project_header_row_visible(
                 best_visible = row_visible
 
     if best_row is None:
-        raise RuntimeError("Project 헤더 행(Project 1, Project 2, ...)을 찾지 못했습니다.")
+        return None
 
     # contiguous 구간만 사용
     cols = sorted(best_visible.keys())
@@ -185,7 +231,7 @@ def find_project_header_row_visible(
     return best_row, dedup
 
 
-def find_best_project_map_in_workbook(wb) -> Optional[Dict[str, str]]:
+def find_best_project_map_in_workbook(sheets: List[CapexSheetGrid]) -> Optional[Dict[str, str]]:
     """
     워크북 전체에서 Project 1..n 헤더가 가장 잘 잡히는 시트를 찾아
     col_letter -> project_name 형태로 반환.
@@ -193,12 +239,12 @@ def find_best_project_map_in_workbook(wb) -> Optional[Dict[str, str]]:
     best_map: Optional[Dict[str, str]] = None
     best_cnt = 0
 
-    for ws in wb.worksheets:
+    for ws in sheets:
         try:
             _, mp = find_project_header_row_visible(ws, scan_max_rows=1500)
             if mp and len(mp) > best_cnt:
                 best_cnt = len(mp)
-                best_map = {get_column_letter(c): mp[c] for c in sorted(mp.keys())}
+                best_map = {ws.col_letters[c]: mp[c] for c in sorted(mp.keys())}
         except Exception:
             continue
 
@@ -209,19 +255,22 @@ def find_best_project_map_in_workbook(wb) -> Optional[Dict[str, str]]:
 # Capex sheet locate
 # -----------------------------
 
-def find_capex_sheet_or_ws(wb) -> Any:
+def find_capex_sheet_or_ws(
+    sheets: List[CapexSheetGrid],
+    active: Optional[CapexSheetGrid] = None,
+) -> CapexSheetGrid:
     """
     1) Unit + Cost... 형태의 CAPEX 테이블이 실제로 탐지되는 시트를 우선 선택
        - INPUTSHEET 계열 우선
        - CAPEX 시트명 계열 차순위
     2) 그래도 없으면 기존 규칙(capex 시트명/셀 텍스트) 사용
-    3) 최종적으로 active 반환
+    3) 최종적으로 active 반환 (active가 워크시트가 아니면 첫 워크시트)
     """
     prioritized: list[Any] = []
     secondary: list[Any] = []
     others: list[Any] = []
 
-    for ws in wb.worksheets:
+    for ws in sheets:
         name = (ws.title or "").lower()
         if "inputsheet" in name:
             prioritized.append(ws)
@@ -230,7 +279,7 @@ def find_capex_sheet_or_ws(wb) -> Any:
         else:
             others.append(ws)
 
-    for ws in prioritized + secondary + others:
+    for ws in chain(prioritized, secondary, others):
         try:
             find_capex_table_header(ws)
             return ws
@@ -240,17 +289,19 @@ def find_capex_sheet_or_ws(wb) -> Any:
     for ws in secondary:
         return ws
 
+    # 여기까지 왔으면 secondary는 비어 있으므로 모든 시트를 셀 텍스트로 확인
     target = "capex"
-    for ws in wb.worksheets:
-        max_rows = min(ws.max_row, 800)
+    for ws in sheets:
         max_cols = min(ws.max_column, 200)
-        for r in range(1, max_rows + 1):
-            for c in range(1, max_cols + 1):
-                v = norm_text(ws.cell(r, c).value)
-                if v and v.strip().lower() == target:
-                    return ws
+        for row in ws.rows[1:801]:
+            if any(isinstance(v, str) and v.strip().lower() == target for v in row[1:max_cols + 1]):
+                return ws
 
-    return wb.active
+    if active is not None:
+        return active
+    if sheets:
+        return sheets[0]
+    raise RuntimeError("Capex 표 헤더( Unit + Cost... )를 찾지 못했습니다. 헤더 구조를 확인해 주십시오.")
 
 
 # -----------------------------
@@ -267,16 +318,18 @@ def find_capex_table_header(ws, scan_max_rows: int = 250, scan_max_cols: int = 2
     max_cols = min(ws.max_column, scan_max_cols)
 
     for r in range(1, max_rows + 1):
+        row = ws.rows[r]
         for c in range(1, max_cols + 1):
-            v = norm_text(ws.cell(r, c).value)
-            if not v or v.strip().lower() != "unit":
+            v = row[c]
+            # 문자열이 아니거나 4자 미만이면 strip/lower 없이 건너뜀
+            if not isinstance(v, str) or len(v) < 4 or v.strip().lower() != "unit":
                 continue
 
             # 오른쪽에 Cost 몇 개나 있는지 점수화
             cost_count = 0
             for cc in range(c + 1, min(max_cols, c + 25) + 1):
-                vv = norm_text(ws.cell(r, cc).value)
-                if vv and vv.strip().lower() == "cost":
+                vv = norm_text(row[cc])
+                if vv and vv.lower() == "cost":
                     cost_count += 1
 
             if cost_count >= 2:
@@ -301,34 +354,33 @@ def detect_label_col(ws, header_row: int, unit_col: int) -> int:
     if not candidates:
         return 1
 
-    best_col = candidates[0]
-    best_score = -1
+    fl = CAPEX_FIELD_LABELS
+    scores: Dict[int, int] = {}
 
     for col in candidates:
         score = 0
-        for r in range(header_row + 1, max_rows + 1):
-            v = norm_text(ws.cell(r, col).value)
-            if not v:
+        lowered = lower_labels(ws, col, max_rows)
+        # 아래에서 위로 한 번만 훑으며 가장 가까운 다음 필드라벨 행을 기억
+        next_field_row = max_rows + 6
+        for r in range(max_rows, header_row, -1):
+            lw = lowered[r]
+            if not lw:
                 continue
-            lw = v.strip().lower()
 
             # 필드 라벨 직접 매치: 높은 점수
-            if lw in CAPEX_FIELD_LABELS:
+            if lw in fl:
                 score += 5
+                next_field_row = r
                 continue
 
             # 카테고리 헤더처럼 보이고, 아래 5줄 내 필드라벨이 나오면 가산
-            for rr in range(r + 1, min(r + 6, max_rows + 1)):
-                nxt = norm_text(ws.cell(rr, col).value)
-                if nxt and nxt.strip().lower() in CAPEX_FIELD_LABELS:
-                    score += 1
-                    break
+            if next_field_row <= r + 5:
+                score += 1
 
-        if score > best_score:
-            best_score = score
-            best_col = col
+        scores[col] = score
 
-    return best_col
+    # 동점이면 앞쪽 열 우선
+    return max(candidates, key=scores.__getitem__)
 
 
 def choose_prompt_col(label_col: int, unit_col: int) -> int:
@@ -350,13 +402,19 @@ def choose_prompt_col(label_col: int, unit_col: int) -> int:
 # -----------------------------
 
 def column_has_data(ws, col: int, rows: List[int]) -> bool:
+    # json_or_blank 변환 없이 '빈 값'(None, 공백/"-" 문자열, Excel 0일자)만 걸러냄
     for r in rows:
         if r < 1 or r > ws.max_row:
             continue
-        v = ws.cell(r, col).value
-        vv = blank_if_empty(to_json_value(v))
-        if vv != "":
-            return True
+        v = ws.rows[r][col]
+        if v is None:
+            continue
+        if isinstance(v, str):
+            if v.strip() in ("", "-"):
+                continue
+        elif type(v) is datetime.date and v == EXCEL_ZERO_DATE:
+            continue
+        return True
     return False
 
 
@@ -372,26 +430,31 @@ def build_project_cols_for_table_robust(
     2) global_col_to_project로 (열 문자 기준) 매핑
     3) 헤더 없이도 실제 데이터가 있는 열을 기준으로 Project 1..n 생성
     """
+    visible = ws.visible
+    col_letters = ws.col_letters
+
     # 1) 현재 시트에서 Project 헤더 찾기
     try:
         _, mp = find_project_header_row_visible(ws, scan_max_rows=1500)
         if mp:
             cols = sorted(mp.keys())
-            return mp, [{"project": mp[c], "col": get_column_letter(c)} for c in cols]
+            return mp, [{"project": mp[c], "col": col_letters[c]} for c in cols]
     except Exception:
         pass
 
     # 2) global map 적용
     project_cols_map: Dict[int, str] = {}
     if global_col_to_project:
+        # 시트 범위 밖 열 문자는 역인덱스에 없으므로 자연히 제외
+        col_index = {letter: i for i, letter in enumerate(col_letters) if i}
         for col_letter, pname in global_col_to_project.items():
-            col_idx = column_index_from_string(col_letter)
-            if col_idx <= ws.max_column and col_idx > unit_col and is_column_visible(ws, col_idx):
+            col_idx = col_index.get(col_letter)
+            if col_idx is not None and col_idx > unit_col and visible[col_idx]:
                 project_cols_map[col_idx] = pname
 
         if project_cols_map:
             cols = sorted(project_cols_map.keys())
-            return project_cols_map, [{"project": project_cols_map[c], "col": get_column_letter(c)} for c in cols]
+            return project_cols_map, [{"project": project_cols_map[c], "col": col_letters[c]} for c in cols]
 
     # 3) 데이터 기반 탐지 (header_row 주변)
     sample_rows = [header_row, header_row + 1, header_row + 2, header_row + 3, header_row + 4]
@@ -402,7 +465,7 @@ def build_project_cols_for_table_robust(
     idx = 1
 
     for c in range(unit_col + 1, ws.max_column + 1):
-        if not is_column_visible(ws, c):
+        if not visible[c]:
             continue
 
         has = column_has_data(ws, c, sample_rows)
@@ -410,7 +473,7 @@ def build_project_cols_for_table_robust(
         if has:
             started = True
             empty_run = 0
-            col_letter = get_column_letter(c)
+            col_letter = col_letters[c]
             pname = global_col_to_project.get(col_letter) if global_col_to_project else None
             if not pname:
                 pname = f"Project {idx}"
@@ -434,52 +497,52 @@ def build_project_cols_for_table_robust(
 
     project_cols_map = dedup
     cols = sorted(project_cols_map.keys())
-    return project_cols_map, [{"project": project_cols_map[c], "col": get_column_letter(c)} for c in cols]
+    return project_cols_map, [{"project": project_cols_map[c], "col": col_letters[c]} for c in cols]
 
 
 # -----------------------------
 # Capex parsing helpers
 # -----------------------------
 
-def is_category_header_generic(ws, r: int, label_col: int, field_labels: set) -> bool:
-    label = norm_text(ws.cell(r, label_col).value)
-    if not label:
+def is_category_header_generic(label_lower: List[Optional[str]], r: int, field_labels: frozenset) -> bool:
+    lw = label_lower[r]
+    if not lw:
         return False
-    if label.strip().lower() in field_labels:
+    if lw in field_labels:
         return False
 
-    for rr in range(r + 1, min(r + 6, ws.max_row + 1)):
-        nxt = norm_text(ws.cell(rr, label_col).value)
-        if nxt and nxt.strip().lower() in field_labels:
+    for rr in range(r + 1, min(r + 6, len(label_lower))):
+        if label_lower[rr] in field_labels:
             return True
     return False
 
 
+def month_id_of(v: Any) -> Optional[int]:
+    """1~24 사이 정수(또는 정수형 float/숫자 문자열)면 월 번호로 반환."""
+    if isinstance(v, int):
+        return v if 1 <= v <= 24 else None
+    if isinstance(v, float):
+        if v.is_integer():
+            iv = int(v)
+            if 1 <= iv <= 24:
+                return iv
+        return None
+    if isinstance(v, str):
+        s = v.strip()
+        if s.isdigit():
+            iv = int(s)
+            if 1 <= iv <= 24:
+                return iv
+    return None
+
+
 def extract_month_id_from_row(ws, r: int, label_col: int, prompt_col: int, unit_col: int) -> Optional[int]:
-    candidates = [
-        ws.cell(r, unit_col).value,
-        ws.cell(r, prompt_col).value,
-        ws.cell(r, label_col).value,
-    ]
-    for v in candidates:
-        vv = to_json_value(v)
-        if vv is None:
-            continue
-        if isinstance(vv, int) and 1 <= vv <= 24:
-            return vv
-        if isinstance(vv, float):
-            try:
-                iv = int(vv)
-                if iv == vv and 1 <= iv <= 24:
-                    return iv
-            except Exception:
-                pass
-        if isinstance(vv, str):
-            s = vv.strip()
-            if s.isdigit():
-                iv = int(s)
-                if 1 <= iv <= 24:
-                    return iv
+    # to_json_value 변환 없이 셀 원값의 타입만 보고 바로 판정 (날짜/시간은 월 번호가 될 수 없음)
+    row = ws.rows[r]
+    for c in (unit_col, prompt_col, label_col):
+        month_id = month_id_of(row[c])
+        if month_id is not None:
+            return month_id
     return None
 
 
@@ -488,11 +551,20 @@ def extract_month_id_from_row(ws, r: int, label_col: int, prompt_col: int, unit_
 # -----------------------------
 
 def extract_capex_from_workbook(xlsx_path: str, include_meta: bool = False) -> Dict[str, Any]:
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
+    # read_only 모드로 열어 모든 시트를 iter_rows로 한 번씩만 읽고 바로 닫는다
+    # (read_only 시트에는 column_dimensions가 없으므로 열 숨김/너비는 zip의 시트 XML에서 따로 읽음)
+    col_dims = read_column_dimensions(xlsx_path)
+    wb = openpyxl.load_workbook(xlsx_path, data_only=True, read_only=True)
+    try:
+        sheets = [CapexSheetGrid(w, col_dims.get(w.title, {})) for w in wb.worksheets]
+        active_ws = wb.active
+        active = next((g for w, g in zip(wb.worksheets, sheets) if w is active_ws), None)
+    finally:
+        wb.close()
 
-    global_map = find_best_project_map_in_workbook(wb)
+    global_map = find_best_project_map_in_workbook(sheets)
 
-    ws = find_capex_sheet_or_ws(wb)
+    ws = find_capex_sheet_or_ws(sheets, active)
 
     # 1) Capex 표 헤더( Unit + Cost... ) 찾기
     header_row, unit_col = find_capex_table_header(ws)
@@ -512,127 +584,138 @@ def extract_capex_from_workbook(xlsx_path: str, include_meta: bool = False) -> D
     if not project_col_indices:
         raise RuntimeError("Capex에서 프로젝트 값 열을 찾지 못했습니다. Unit 오른쪽 값 열에 데이터가 있는지 확인해 주십시오.")
 
+    col_letters = ws.col_letters
     per_project: Dict[int, Dict[str, Any]] = {}
     for c in project_col_indices:
         per_project[c] = {
             "name": project_cols_map[c],
-            "col": get_column_letter(c),
+            "col": col_letters[c],
             "capex": {},
         }
 
+    # 프로젝트 열 순서(i)로 접근하는 병렬 리스트. cat_dicts는 카테고리가 바뀔 때만 갱신
+    proj_capex = [per_project[c]["capex"] for c in project_col_indices]
+    proj_col_letters = [col_letters[c] for c in project_col_indices]
+    cat_dicts: List[Dict[str, Any]] = []
+    monthly_dicts: List[Dict[str, Any]] = []
+
+    # label_col 라벨을 행마다 한 번만 소문자 정규화
+    label_lower = lower_labels(ws, label_col, ws.max_row)
+
     current_category: Optional[str] = None
     in_monthly = False
 
     for r in range(header_row + 1, ws.max_row + 1):
-        label = norm_text(ws.cell(r, label_col).value)
+        row = ws.rows[r]
+        label = norm_text(row[label_col])
 
         if not label and not in_monthly:
             continue
 
+        # 프로젝트 열 값은 행마다 한 번만 꺼내고 변환
+        vals = [json_or_blank(row[c]) for c in project_col_indices]
+
         # 카테고리 헤더
-        if label and is_category_header_generic(ws, r, label_col, CAPEX_FIELD_LABELS):
+        if label and is_category_header_generic(label_lower, r, CAPEX_FIELD_LABELS):
             current_category = label
             in_monthly = False
-            for c in project_col_indices:
-                per_project[c]["capex"].setdefault(current_category, {})
+            cat_dicts = [pc.setdefault(current_category, {}) for pc in proj_capex]
 
             # enabled (카테고리 헤더행 값)
+            # 값이 하나라도 있으면 바로 멈추고, 전부 비었으면 아무것도 기록하지 않음
             any_val = False
-            header_vals: Dict[int, Any] = {}
-            for c in project_col_indices:
-                v = blank_if_empty(to_json_value(ws.cell(r, c).value))
-                header_vals[c] = v
+            for v in vals:
                 if v != "":
                     any_val = True
+                    break
             if any_val:
-                for c in project_col_indices:
-                    per_project[c]["capex"][current_category]["enabled"] = header_vals[c]
+                for cd, v in zip(cat_dicts, vals):
+                    cd["enabled"] = v
             continue
 
         if current_category is None:
             current_category = "Capex"
-            for c in project_col_indices:
-                per_project[c]["capex"].setdefault(current_category, {})
+            cat_dicts = [pc.setdefault(current_category, {}) for pc in proj_capex]
 
         # monthly distribution
-        if label and label.strip().lower() == "monthly distribution":
+        lwr = label_lower[r]
+        if lwr == "monthly distribution":
             in_monthly = True
-            for c in project_col_indices:
-                per_project[c]["capex"][current_category].setdefault("Monthly distribution", {})
+            monthly_dicts = [cd.setdefault("Monthly distribution", {}) for cd in cat_dicts]
         else:
-            if in_monthly and label:
-                lwr = label.strip().lower()
-                if lwr in CAPEX_FIELD_LABELS and lwr != "monthly distribution":
-                    in_monthly = False
+            if in_monthly and lwr in CAPEX_FIELD_LABELS:
+                in_monthly = False
 
-        unit_val = blank_if_empty(to_json_value(ws.cell(r, unit_col).value))
-        prompt_val = blank_if_empty(to_json_value(ws.cell(r, prompt_col).value))
+        unit_val = json_or_blank(row[unit_col])
+        prompt_val = json_or_blank(row[prompt_col])
 
         if in_monthly:
             month_id = extract_month_id_from_row(ws, r, label_col, prompt_col, unit_col)
             if month_id is None:
                 continue
 
-            for c in project_col_indices:
-                v = blank_if_empty(to_json_value(ws.cell(r, c).value))
+            month_key = str(month_id)
+            for i, v in enumerate(vals):
                 if include_meta:
-                    per_project[c]["capex"][current_category]["Monthly distribution"][str(month_id)] = {
+                    monthly_dicts[i][month_key] = {
                         "unit": unit_val,
                         "prompt": prompt_val,
                         "value": v,
                         "row": r,
-                        "col": c,
-                        "col_letter": get_column_letter(c),
+                        "col": project_col_indices[i],
+                        "col_letter": proj_col_letters[i],
                     }
                 else:
-                    per_project[c]["capex"][current_category]["Monthly distribution"][str(month_id)] = v
+                    monthly_dicts[i][month_key] = v
             continue
 
         if not label:
             continue
 
         key = label
-        key_lower = key.strip().lower()
+        key_lower = lwr
 
-        row_vals: Dict[int, Any] = {}
-        for c in project_col_indices:
-            v = blank_if_empty(to_json_value(ws.cell(r, c).value))
-            if key_lower == "indexed?":
-                v = normalize_indexed_value(v)
-            row_vals[c] = v
+        if key_lower == "indexed?":
+            row_vals = [normalize_indexed_value(v) for v in vals]
+        else:
+            row_vals = vals
 
         # Comments: 값이 전부 비면 prompt(머지셀 설명)를 복제
         if key_lower == "comments":
-            any_project_comment = any(row_vals[c] != "" for c in project_col_indices)
+            any_project_comment = False
+            for v in row_vals:
+                if v != "":
+                    any_project_comment = True
+                    break
             final_comment_prompt = prompt_val if (not any_project_comment and prompt_val != "") else ""
-            for c in project_col_indices:
-                final_val = row_vals[c] if any_project_comment else (final_comment_prompt or "")
+            for i, cd in enumerate(cat_dicts):
+                final_val = row_vals[i] if any_project_comment else (final_comment_prompt or "")
                 if include_meta:
-                    per_project[c]["capex"][current_category][key] = {
+                    cd[key] = {
                         "unit": unit_val,
                         "prompt": prompt_val,
                         "value": final_val,
                         "row": r,
-                        "col": c,
-                        "col_letter": get_column_letter(c),
+                        "col": project_col_indices[i],
+                        "col_letter": proj_col_letters[i],
                     }
                 else:
-                    per_project[c]["capex"][current_category][key] = final_val
+                    cd[key] = final_val
             continue
 
-        for c in project_col_indices:
-            v = row_vals[c]
+        for i, cd in enumerate(cat_dicts):
+            v = row_vals[i]
             if include_meta:
-                per_project[c]["capex"][current_category][key] = {
+                cd[key] = {
                     "unit": unit_val,
                     "prompt": prompt_val,
                     "value": v,
                     "row": r,
-                    "col": c,
-                    "col_letter": get_column_letter(c),
+                    "col": project_col_indices[i],
+                    "col_letter": proj_col_letters[i],
                 }
             else:
-                per_project[c]["capex"][current_category][key] = v
+                cd[key] = v
 
     projects = [per_project[c] for c in project_col_indices]
 
@@ -641,9 +724,9 @@ def extract_capex_from_workbook(xlsx_path: str, include_meta: bool = False) -> D
             "file": xlsx_path,
             "sheet": ws.title,
             "header_row": header_row,
-            "label_col": get_column_letter(label_col),
-            "prompt_col": get_column_letter(prompt_col),
-            "unit_col": get_column_letter(unit_col),
+            "label_col": col_letters[label_col],
+            "prompt_col": col_letters[prompt_col],
+            "unit_col": col_letters[unit_col],
             "projects_detected": [project_cols_map[c] for c in project_col_indices],
             "project_columns": project_columns_list,
             "used_global_project_map": bool(global_map),
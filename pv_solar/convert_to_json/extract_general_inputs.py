@@ -3,15 +3,20 @@
 
 import argparse
 import json
-import re
 import datetime
+import sys
+from collections import namedtuple
 from pathlib import Path
 from typing import Any, Dict, Tuple, Optional, List
 
 import openpyxl
-from openpyxl.utils.cell import get_column_letter, column_index_from_string
+from openpyxl.utils.cell import column_index_from_string
+
+try:
+    from sheet_grid import SheetGrid, read_column_dimensions
+except ModuleNotFoundError:
+    from pv_solar.convert_to_json.sheet_grid import SheetGrid, read_column_dimensions
 
-PROJECT_RE = re.compile(r"^Project\s*\d+\s*$", re.IGNORECASE)
 
 # 문서에 존재할 수 있는 "Top-level 섹션명" 목록 (필요 시 추가)
 TOP_LEVEL_SECTIONS = [
@@ -25,13 +30,12 @@ TOP_LEVEL_SECTIONS = [
     "Equity",
     "Assumptions",
 ]
+TOP_LEVEL_SECTIONS_LC = frozenset(s.strip().lower() for s in TOP_LEVEL_SECTIONS)
 
 
-def norm_text(v: Any) -> Optional[str]:
-    if not isinstance(v, str):
-        return None
-    s = v.strip()
-    return s if s else None
+def is_project_label(s: str) -> bool:
+    """strip된 문자열이 'Project <숫자>' 형태인지 (대소문자 무시, 사이 공백 허용)."""
+    return s[:7].lower() == "project" and s[7:].lstrip().isdecimal()
 
 
 # def to_json_value(v: Any) -> Any:
@@ -59,48 +63,37 @@ def norm_text(v: Any) -> Optional[str]:
 #         return v.strip()
 
 #     return v
-def to_json_value(v: Any) -> Any:
-    if v is None:
-        return None
-
-    if isinstance(v, (datetime.datetime, datetime.date)):
-        return v.isoformat()
-
-    # ✅ time 타입도 JSON 가능하게
-    if isinstance(v, datetime.time):
-        return v.isoformat()
-
-    if isinstance(v, float) and v.is_integer():
-        return int(v)
+def _isoformat(v: Any) -> str:
+    return v.isoformat()
 
-    if isinstance(v, str):
-        return v.strip()
 
+def _identity(v: Any) -> Any:
     return v
 
 
-def is_column_visible(ws, col_idx: int) -> bool:
-    """
-    '실질적으로 눈에 보이는 열' 판별
-    - hidden=True 또는 width=0이면 제외
-    """
-    letter = get_column_letter(col_idx)
-    dim = ws.column_dimensions.get(letter)
-    if dim is None:
-        return True
+# 셀 값의 정확한 타입 -> 변환 함수 (서브클래스는 to_json_value의 isinstance 분기로 처리)
+JSON_VALUE_CONVERTERS = {
+    type(None): _identity,
+    str: str.strip,
+    int: _identity,
+    bool: _identity,
+    float: lambda v: int(v) if v.is_integer() else v,
+    datetime.datetime: _isoformat,
+    datetime.date: _isoformat,
+    datetime.time: _isoformat,
+}
 
-    if getattr(dim, "hidden", False):
-        return False
 
-    width = getattr(dim, "width", None)
-    if width is not None:
-        try:
-            if float(width) == 0.0:
-                return False
-        except Exception:
-            pass
+def to_json_value(v: Any) -> Any:
+    conv = JSON_VALUE_CONVERTERS.get(type(v))
+    if conv is not None:
+        return conv(v)
 
-    return True
+    for t, conv in JSON_VALUE_CONVERTERS.items():
+        if isinstance(v, t):
+            return conv(v)
+
+    return v
 
 
 def find_project_header_row_visible(
@@ -121,18 +114,24 @@ def find_project_header_row_visible(
     best_visible: Dict[int, str] = {}
     best_hidden: Dict[int, str] = {}
 
+    visible = ws.visible
+    col_letters = ws.col_letters
+
     max_rows = min(ws.max_row, scan_max_rows)
     for r in range(1, max_rows + 1):
         row_visible: Dict[int, str] = {}
         row_hidden: Dict[int, str] = {}
+        row = ws.rows[r]
 
-        for c in range(1, ws.max_column + 1):
-            v = ws.cell(r, c).value
-            if isinstance(v, str) and PROJECT_RE.match(v.strip()):
-                if is_column_visible(ws, c):
-                    row_visible[c] = v.strip()
+        for c, v in enumerate(row):
+            if not isinstance(v, str):
+                continue
+            sv = v.strip()
+            if is_project_label(sv):
+                if visible[c]:
+                    row_visible[c] = sv
                 else:
-                    row_hidden[c] = v.strip()
+                    row_hidden[c] = sv
 
         if row_visible:
             if best_row is None or len(row_visible) > len(best_visible):
@@ -143,14 +142,12 @@ def find_project_header_row_visible(
     if best_row is None:
         raise RuntimeError("Project 헤더 행(Project 1, Project 2, ...)을 찾지 못했습니다.")
 
-    # 연속 블록만 유지(오탐 방지)
-    cols = sorted(best_visible.keys())
-    contiguous = [cols[0]]
-    for i in range(1, len(cols)):
-        if cols[i] == cols[i - 1] + 1:
-            contiguous.append(cols[i])
-        else:
-            break
+    # 연속 블록만 유지(오탐 방지): 가장 왼쪽 열부터 빈틈이 나올 때까지 (정렬 불필요)
+    first = min(best_visible)
+    end = first + 1
+    while end in best_visible:
+        end += 1
+    contiguous = range(first, end)
 
     # 중복 Project명 제거(뒤쪽 제거)
     seen = set()
@@ -160,178 +157,233 @@ def find_project_header_row_visible(
         name = best_visible[c]
         if name in seen:
             dropped_duplicates.append(
-                {"project": name, "col": get_column_letter(c), "reason": "duplicate_project_name"}
+                {"project": name, "col": col_letters[c], "reason": "duplicate_project_name"}
             )
             continue
         seen.add(name)
         dedup_map[c] = name
 
     hidden_project_cols = [
-        {"project": best_hidden[c], "col": get_column_letter(c)}
+        {"project": best_hidden[c], "col": col_letters[c]}
         for c in sorted(best_hidden.keys())
     ]
 
     return best_row, dedup_map, hidden_project_cols, dropped_duplicates
 
 
-def find_section_block_by_top_sections(
+def find_all_section_blocks(
     ws,
     label_col: int,
-    section_name: str,
-    top_sections: List[str],
-) -> Optional[Tuple[int, int]]:
+    top_sections: Optional[List[str]] = None,
+) -> Dict[str, Tuple[int, int]]:
     """
-    섹션 범위를 '다음 Top-level 섹션명'이 나올 때까지로 계산합니다.
+    label_col을 한 번만 훑어 모든 Top-level 섹션의 범위를 계산합니다.
+    섹션 범위는 '다음(다른 이름의) Top-level 섹션명'이 나올 때까지입니다.
     (Production 내부 소제목은 종료 조건이 되면 안 되므로 이 방식이 필요합니다.)
+    top_sections를 생략하면 미리 소문자화한 TOP_LEVEL_SECTIONS_LC를 사용합니다.
+    반환: {소문자 섹션명: (start_row, end_row)}  (같은 이름이 여러 번이면 첫 번째 기준)
     """
-    target = section_name.strip().lower()
-    top_set = {s.strip().lower() for s in top_sections if s and s.strip()}
+    if top_sections is None:
+        top_set = TOP_LEVEL_SECTIONS_LC
+    else:
+        top_set = {lc for lc in (s.strip().lower() for s in top_sections if s) if lc}
+
+    matches: List[Tuple[int, str]] = []
+    for r, v in enumerate(ws.column(label_col)):
+        if not isinstance(v, str):
+            continue
+        lc = v.strip().lower()
+        if lc in top_set:
+            matches.append((r, lc))
 
-    start_header: Optional[int] = None
-    for r in range(1, ws.max_row + 1):
-        v = norm_text(ws.cell(r, label_col).value)
-        if v and v.lower() == target:
-            start_header = r
-            break
+    blocks: Dict[str, Tuple[int, int]] = {}
+    for i, (start_header, name) in enumerate(matches):
+        if name in blocks:
+            continue
+        end = ws.max_row + 1
+        for r, other in matches[i + 1:]:
+            if other != name:
+                end = r
+                break
+        blocks[name] = (start_header + 1, end)
 
-    if start_header is None:
-        return None
+    return blocks
 
-    end = ws.max_row + 1
-    for r in range(start_header + 1, ws.max_row + 1):
-        v = norm_text(ws.cell(r, label_col).value)
-        if v and v.lower() in top_set and v.lower() != target:
-            end = r
-            break
 
-    return start_header + 1, end
+# 추출에 쓰는 열 묶음: label/type 열 인덱스, 프로젝트 값 열 인덱스 리스트와 그 열 문자 리스트
+SectionCols = namedtuple("SectionCols", "label type values letters")
 
 
-def is_group_header_row(ws, r: int, label_col: int, type_col: int, value_col: int) -> bool:
+def section_rows(
+    ws,
+    start_row: int,
+    end_row: int,
+    cols: SectionCols,
+    with_type: bool = True,
+) -> List[Tuple[int, str, Any, List[Any]]]:
     """
-    Production 내부 소제목/그룹 헤더 판별:
-    - label 있음
-    - type_col 비어있음
-    - value_col 비어있음
+    섹션 행을 (row, label, type 원값, 프로젝트 열 원값 리스트)로 미리 펼쳐 둡니다.
+    label이 문자열이 아니거나 strip 후 빈 문자열인 행은 제외.
+    label은 intern하여 모든 프로젝트 dict(키/그룹명)가 같은 문자열 객체를 공유.
+    with_type=False면 type 열은 읽지 않고 None으로 채웁니다.
     """
-    label = norm_text(ws.cell(r, label_col).value)
-    if not label:
-        return False
-    t = ws.cell(r, type_col).value
-    if t is not None and norm_text(t):
-        return False
-    if ws.cell(r, value_col).value is not None:
-        return False
-    return True
-
-
-def extract_section_kv_for_project_flat(
+    labels = ws.column(cols.label)
+    types = ws.column(cols.type) if with_type else [None] * len(labels)
+    value_cols = cols.values
+    out: List[Tuple[int, str, Any, List[Any]]] = []
+    for r in range(start_row, end_row):
+        label = labels[r]
+        if not isinstance(label, str):
+            continue
+        label = label.strip()
+        if not label:
+            continue
+        label = sys.intern(label)
+        row = ws.rows[r]
+        out.append((r, label, types[r], [row[c] for c in value_cols]))
+    return out
+
+
+def extract_section_kv_flat_all_projects(
     ws,
     start_row: int,
     end_row: int,
-    label_col: int,
-    type_col: int,
-    value_col: int,
+    cols: SectionCols,
     include_meta: bool,
     include_empty: bool,
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
     General inputs처럼 단순 Key-Value로 추출
+    - 행마다 label/type은 한 번만 읽고 모든 프로젝트 열(cols.values)에 나눠 담음
+    - include_meta 여부에 따라 전용 루프로 분기
+    - 반환: cols.values 순서와 같은 프로젝트별 dict 리스트
     """
-    out: Dict[str, Any] = {}
-    for r in range(start_row, end_row):
-        key = norm_text(ws.cell(r, label_col).value)
-        if not key:
-            continue
+    # type 값은 meta에만 쓰이므로 plain이면 type 열을 읽지 않음
+    rows = section_rows(ws, start_row, end_row, cols, with_type=include_meta)
+    if include_meta:
+        return _extract_flat_meta(rows, cols, include_empty)
+    return _extract_flat_plain(rows, cols, include_empty)
+
+
+def _extract_flat_plain(rows, cols: SectionCols, include_empty: bool) -> List[Dict[str, Any]]:
+    outs: List[Dict[str, Any]] = [{} for _ in cols.values]
+    for _, key, _, raw_vals in rows:
+        for out, raw_val in zip(outs, raw_vals):
+            val = to_json_value(raw_val)
+            if (val is None) and (not include_empty):
+                continue
+            out[key] = val
+    return outs
 
-        val = to_json_value(ws.cell(r, value_col).value)
-        if (val is None) and (not include_empty):
-            continue
 
-        if include_meta:
-            out[key] = {
-                "type": to_json_value(ws.cell(r, type_col).value),
+def _extract_flat_meta(rows, cols: SectionCols, include_empty: bool) -> List[Dict[str, Any]]:
+    value_cols, value_letters = cols.values, cols.letters
+    outs: List[Dict[str, Any]] = [{} for _ in value_cols]
+    for r, key, raw_type, raw_vals in rows:
+        tval = to_json_value(raw_type)
+
+        for i, raw_val in enumerate(raw_vals):
+            val = to_json_value(raw_val)
+            if (val is None) and (not include_empty):
+                continue
+
+            outs[i][key] = {
+                "type": tval,
                 "value": val,
                 "row": r,
-                "col": value_col,
-                "col_letter": get_column_letter(value_col),
+                "col": value_cols[i],
+                "col_letter": value_letters[i],
             }
-        else:
-            out[key] = val
-    return out
+    return outs
 
 
-def extract_section_kv_for_project_grouped(
+def extract_section_kv_grouped_all_projects(
     ws,
     start_row: int,
     end_row: int,
-    label_col: int,
-    type_col: int,
-    value_col: int,
+    cols: SectionCols,
     include_meta: bool,
     include_empty: bool,
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
     Production처럼 소제목(그룹)이 있는 섹션을 그룹화하여 추출
     - include_empty=True이면 빈 값도 포함하고 value는 ""(공백 문자열)로 저장
+    - 소제목 판별(label 있음 + type_col/value_col 비어있음)은 value_col이 프로젝트마다 다르므로
+      현재 그룹도 프로젝트별로 유지
+    - include_meta 여부에 따라 전용 루프로 분기
+    - 반환: cols.values 순서와 같은 프로젝트별 dict 리스트
     """
-    out: Dict[str, Any] = {}
-    current_group: Optional[str] = None
+    rows = section_rows(ws, start_row, end_row, cols)
+    if include_meta:
+        return _extract_grouped_meta(rows, cols, include_empty)
+    return _extract_grouped_plain(rows, cols, include_empty)
 
-    for r in range(start_row, end_row):
-        label = norm_text(ws.cell(r, label_col).value)
-        if not label:
-            continue
 
-        # 그룹 헤더(소제목)
-        if is_group_header_row(ws, r, label_col, type_col, value_col):
-            current_group = label
-            # 그룹이 미리 생성되길 원하면 아래 한 줄 활성화
-            # out.setdefault(current_group, {})
-            continue
+def _extract_grouped_plain(rows, cols: SectionCols, include_empty: bool) -> List[Dict[str, Any]]:
+    outs: List[Dict[str, Any]] = [{} for _ in cols.values]
+    current_groups: List[Optional[str]] = [None] * len(cols.values)
 
-        raw_val = ws.cell(r, value_col).value
-        val = to_json_value(raw_val)
+    for _, label, raw_type, raw_vals in rows:
+        type_blank = not (isinstance(raw_type, str) and raw_type.strip())
 
-        # ✅ 빈값 처리: include_empty=True면 ""로 저장
-        if val is None:
-            if not include_empty:
+        for i, raw_val in enumerate(raw_vals):
+            # 그룹 헤더(소제목)
+            if type_blank and raw_val is None:
+                current_groups[i] = label
                 continue
-            val = ""
-
-        if current_group:
-            grp = out.setdefault(current_group, {})
-            if include_meta:
-                raw_type = ws.cell(r, type_col).value
-                tval = to_json_value(raw_type)
-                if tval is None and include_empty:
-                    tval = ""
-                grp[label] = {
-                    "type": tval,
-                    "value": val,
-                    "row": r,
-                    "col": value_col,
-                    "col_letter": get_column_letter(value_col),
-                }
-            else:
-                grp[label] = val
-        else:
-            if include_meta:
-                raw_type = ws.cell(r, type_col).value
-                tval = to_json_value(raw_type)
-                if tval is None and include_empty:
-                    tval = ""
-                out[label] = {
-                    "type": tval,
-                    "value": val,
-                    "row": r,
-                    "col": value_col,
-                    "col_letter": get_column_letter(value_col),
-                }
-            else:
-                out[label] = val
 
-    return out
+            val = to_json_value(raw_val)
+
+            # ✅ 빈값 처리: include_empty=True면 ""로 저장
+            if val is None:
+                if not include_empty:
+                    continue
+                val = ""
+
+            current_group = current_groups[i]
+            dst = outs[i].setdefault(current_group, {}) if current_group else outs[i]
+            dst[label] = val
+
+    return outs
+
+
+def _extract_grouped_meta(rows, cols: SectionCols, include_empty: bool) -> List[Dict[str, Any]]:
+    value_cols, value_letters = cols.values, cols.letters
+    outs: List[Dict[str, Any]] = [{} for _ in value_cols]
+    current_groups: List[Optional[str]] = [None] * len(value_cols)
+
+    for r, label, raw_type, raw_vals in rows:
+        type_blank = not (isinstance(raw_type, str) and raw_type.strip())
+
+        tval = to_json_value(raw_type)
+        if tval is None and include_empty:
+            tval = ""
+
+        for i, raw_val in enumerate(raw_vals):
+            # 그룹 헤더(소제목)
+            if type_blank and raw_val is None:
+                current_groups[i] = label
+                continue
+
+            val = to_json_value(raw_val)
+
+            # ✅ 빈값 처리: include_empty=True면 ""로 저장
+            if val is None:
+                if not include_empty:
+                    continue
+                val = ""
+
+            current_group = current_groups[i]
+            dst = outs[i].setdefault(current_group, {}) if current_group else outs[i]
+            dst[label] = {
+                "type": tval,
+                "value": val,
+                "row": r,
+                "col": value_cols[i],
+                "col_letter": value_letters[i],
+            }
+
+    return outs
 
 
 def extract_all_projects_gi_and_production_visible(
@@ -339,8 +391,15 @@ def extract_all_projects_gi_and_production_visible(
     label_col_letter: str = "B",
     include_meta: bool = False,
 ) -> Dict[str, Any]:
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
-    ws = wb.active  # 활성 시트만
+    # read_only 모드로 활성 시트만 iter_rows로 한 번 읽고 바로 닫는다
+    # (read_only 시트에는 column_dimensions가 없으므로 열 숨김/너비는 zip의 시트 XML에서 따로 읽음)
+    wb = openpyxl.load_workbook(xlsx_path, data_only=True, read_only=True)
+    try:
+        active = wb.active  # 활성 시트만
+        col_dims = read_column_dimensions(xlsx_path, [active.title]).get(active.title, {})
+        ws = SheetGrid(active, col_dims)
+    finally:
+        wb.close()
 
     header_row, project_cols_map, hidden_project_cols, dropped_duplicates = find_project_header_row_visible(ws)
     project_col_indices = sorted(project_cols_map.keys())
@@ -350,8 +409,9 @@ def extract_all_projects_gi_and_production_visible(
     label_col = column_index_from_string(label_col_letter)
     type_col = label_col + 1
 
-    gi_block = find_section_block_by_top_sections(ws, label_col, "General inputs", TOP_LEVEL_SECTIONS)
-    prod_block = find_section_block_by_top_sections(ws, label_col, "Production", TOP_LEVEL_SECTIONS)
+    blocks = find_all_section_blocks(ws, label_col)
+    gi_block = blocks.get("general inputs")
+    prod_block = blocks.get("production")
 
     missing_sections = []
     if gi_block is None:
@@ -359,41 +419,41 @@ def extract_all_projects_gi_and_production_visible(
     if prod_block is None:
         missing_sections.append("Production")
 
-    projects: List[Dict[str, Any]] = []
-    for col_idx in project_col_indices:
-        pname = project_cols_map[col_idx]
-        col_letter = get_column_letter(col_idx)
-
-        general_inputs: Dict[str, Any] = {}
-        production: Dict[str, Any] = {}
-
-        if gi_block is not None:
-            gi_start, gi_end = gi_block
-            # General inputs는 null도 유지하는 편이 보통 유리
-            general_inputs = extract_section_kv_for_project_flat(
-                ws, gi_start, gi_end, label_col, type_col, col_idx,
-                include_meta=include_meta,
-                include_empty=True
-            )
+    # 섹션별로 행을 한 번만 훑어 모든 프로젝트 열 값을 함께 추출
+    cols = SectionCols(
+        label=label_col,
+        type=type_col,
+        values=project_col_indices,
+        letters=[ws.col_letters[c] for c in project_col_indices],
+    )
+    n_projects = len(project_col_indices)
+    general_inputs_all: List[Dict[str, Any]] = [{} for _ in range(n_projects)]
+    production_all: List[Dict[str, Any]] = [{} for _ in range(n_projects)]
+
+    if gi_block is not None:
+        gi_start, gi_end = gi_block
+        # General inputs는 null도 유지하는 편이 보통 유리
+        general_inputs_all = extract_section_kv_flat_all_projects(
+            ws, gi_start, gi_end, cols,
+            include_meta=include_meta,
+            include_empty=True
+        )
 
-        if prod_block is not None:
-            pr_start, pr_end = prod_block
-            # Production은 값이 있는 것만 추출(빈칸은 제외) + 그룹화
-            # production = extract_section_kv_for_project_grouped(
-            #     ws, pr_start, pr_end, label_col, type_col, col_idx,
-            #     include_meta=include_meta,
-            #     include_empty=False
-            # )
-            production = extract_section_kv_for_project_grouped(
-                ws, pr_start, pr_end, label_col, type_col, col_idx,
-                include_meta=include_meta,
-                include_empty=True   # ✅ 빈값도 포함 + "" 처리
-            )
+    if prod_block is not None:
+        pr_start, pr_end = prod_block
+        # Production은 그룹화 + 빈값도 포함("" 처리)
+        production_all = extract_section_kv_grouped_all_projects(
+            ws, pr_start, pr_end, cols,
+            include_meta=include_meta,
+            include_empty=True   # ✅ 빈값도 포함 + "" 처리
+        )
 
+    projects: List[Dict[str, Any]] = []
+    for col_idx, general_inputs, production in zip(project_col_indices, general_inputs_all, production_all):
         projects.append(
             {
-                "name": pname,
-                "col": col_letter,
+                "name": project_cols_map[col_idx],
+                "col": ws.col_letters[col_idx],
                 "general_inputs": general_inputs,
                 "production": production,
             }
@@ -406,7 +466,7 @@ def extract_all_projects_gi_and_production_visible(
             "project_header_row": header_row,
             "label_col": label_col_letter,
             "projects_detected": [project_cols_map[c] for c in project_col_indices],
-            "project_columns": [{"project": project_cols_map[c], "col": get_column_letter(c)} for c in project_col_indices],
+            "project_columns": [{"project": project_cols_map[c], "col": ws.col_letters[c]} for c in project_col_indices],
             "hidden_project_columns": hidden_project_cols,
             "dropped_duplicate_projects": dropped_duplicates,
             "missing_sections": missing_sections,
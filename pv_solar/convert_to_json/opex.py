@@ -11,7 +11,11 @@ from typing import Any, Dict, Tuple, Optional, List
 import openpyxl
 from openpyxl.utils.cell import get_column_letter, column_index_from_string
 
-PROJECT_RE = re.compile(r"^Project\s*\d+\s*$", re.IGNORECASE)
+try:
+    from sheet_grid import SheetGrid, read_column_dimensions
+except ModuleNotFoundError:
+    from pv_solar.convert_to_json.sheet_grid import SheetGrid, read_column_dimensions
+
 
 # Top-level 섹션명 후보(섹션 끝 경계 판단용). 필요 시 추가하세요.
 TOP_LEVEL_SECTIONS = [
@@ -27,9 +31,10 @@ TOP_LEVEL_SECTIONS = [
     "Equity",
     "Assumptions",
 ]
+TOP_LEVEL_SECTIONS_LC = frozenset(s.strip().lower() for s in TOP_LEVEL_SECTIONS)
 
 # Opex 표에서 자주 등장하는 필드 라벨(카테고리 헤더 판별용)
-OPEX_FIELD_LABELS = {
+OPEX_FIELD_LABELS = frozenset({
     "currency",
     "cost",
     "indexed?",
@@ -39,7 +44,7 @@ OPEX_FIELD_LABELS = {
     "comments",
     "hectares",
     "unit",
-}
+})
 
 # Excel 0-date 계열(의미 없는 날짜) 방지
 EXCEL_ZERO_DATE = datetime.date(1899, 12, 30)
@@ -48,6 +53,11 @@ EXCEL_ZERO_DATE = datetime.date(1899, 12, 30)
 P_LABEL_RE = re.compile(r"^P\d+\s*$", re.IGNORECASE)
 
 
+def is_project_label(s: str) -> bool:
+    """strip된 문자열이 'Project <숫자>' 형태인지 (대소문자 무시, 사이 공백 허용)."""
+    return s[:7].lower() == "project" and s[7:].lstrip().isdecimal()
+
+
 def norm_text(v: Any) -> Optional[str]:
     if not isinstance(v, str):
         return None
@@ -101,6 +111,21 @@ def blank_if_empty(v: Any) -> Any:
     return v
 
 
+def json_or_blank(v: Any) -> Any:
+    """blank_if_empty(to_json_value(v))와 같은 결과. 흔한 str/None/숫자는 정확한 타입 비교 한 번으로 처리."""
+    t = type(v)
+    if t is str:
+        s = v.strip()
+        return "" if s == "" or s == "-" else s
+    if v is None:
+        return ""
+    if t is float:
+        return int(v) if v.is_integer() else v
+    if t is int:
+        return v
+    return blank_if_empty(to_json_value(v))
+
+
 def normalize_indexed_value(v: Any) -> str:
     """
     Indexed? 값 정규화:
@@ -137,28 +162,16 @@ def normalize_indexed_value(v: Any) -> str:
     return str(v)
 
 
-def is_column_visible(ws, col_idx: int) -> bool:
+def load_workbook_values(xlsx_path: str):
     """
-    '눈에 보이는 열' 판별:
-    - column_dimensions.hidden == True 또는 width == 0이면 제외
+    값만 읽기 위한 워크북 로드
+    - read_only: 셀 객체/스타일 적용 없이 시트 XML을 스트리밍 (사용 후 close 필요)
+    - keep_links=False: 외부 링크 파트는 파싱하지 않음 (캐시된 셀 값은 data_only로 그대로 읽힘)
+    - rich_text=False: 서식 있는 문자열도 일반 str로
     """
-    letter = get_column_letter(col_idx)
-    dim = ws.column_dimensions.get(letter)
-    if dim is None:
-        return True
-
-    if getattr(dim, "hidden", False):
-        return False
-
-    width = getattr(dim, "width", None)
-    if width is not None:
-        try:
-            if float(width) == 0.0:
-                return False
-        except Exception:
-            pass
-
-    return True
+    return openpyxl.load_workbook(
+        xlsx_path, data_only=True, read_only=True, keep_links=False, rich_text=False
+    )
 
 
 def find_project_header_row_visible(
@@ -180,18 +193,22 @@ def find_project_header_row_visible(
     best_visible: Dict[int, str] = {}
     best_hidden: Dict[int, str] = {}
 
+    visible = ws.visible
+    # 가장 많은 Project 열을 가진 행을 고르므로 첫 매칭 행에서 멈추지 않고 끝까지 본다
     max_rows = min(ws.max_row, scan_max_rows)
     for r in range(1, max_rows + 1):
         row_visible: Dict[int, str] = {}
         row_hidden: Dict[int, str] = {}
 
-        for c in range(1, ws.max_column + 1):
-            v = ws.cell(r, c).value
-            if isinstance(v, str) and PROJECT_RE.match(v.strip()):
-                if is_column_visible(ws, c):
-                    row_visible[c] = v.strip()
+        for c, v in enumerate(ws.rows[r]):
+            if not isinstance(v, str):
+                continue
+            sv = v.strip()
+            if is_project_label(sv):
+                if visible[c]:
+                    row_visible[c] = sv
                 else:
-                    row_hidden[c] = v.strip()
+                    row_hidden[c] = sv
 
         if row_visible:
             if best_row is None or len(row_visible) > len(best_visible):
@@ -219,14 +236,14 @@ def find_project_header_row_visible(
         name = best_visible[c]
         if name in seen:
             dropped_duplicates.append(
-                {"project": name, "col": get_column_letter(c), "reason": "duplicate_project_name"}
+                {"project": name, "col": ws.col_letters[c], "reason": "duplicate_project_name"}
             )
             continue
         seen.add(name)
         dedup_map[c] = name
 
     hidden_project_cols = [
-        {"project": best_hidden[c], "col": get_column_letter(c)}
+        {"project": best_hidden[c], "col": ws.col_letters[c]}
         for c in sorted(best_hidden.keys())
     ]
 
@@ -237,18 +254,22 @@ def find_section_block_by_top_sections(
     ws,
     label_col: int,
     section_name: str,
-    top_sections: List[str],
+    top_sections: Optional[List[str]] = None,
 ) -> Optional[Tuple[int, int]]:
     """
     섹션 범위를 '다음 Top-level 섹션명'이 등장할 때까지로 계산합니다.
     (Production 내부 소제목은 섹션 종료로 보면 안 되므로 이 방식을 사용)
+    top_sections를 생략하면 미리 소문자화한 TOP_LEVEL_SECTIONS_LC를 사용합니다.
     """
     target = section_name.strip().lower()
-    top_set = {s.strip().lower() for s in top_sections if s and s.strip()}
+    if top_sections is None:
+        top_set = TOP_LEVEL_SECTIONS_LC
+    else:
+        top_set = {s.strip().lower() for s in top_sections if s and s.strip()}
 
     start_header: Optional[int] = None
     for r in range(1, ws.max_row + 1):
-        v = norm_text(ws.cell(r, label_col).value)
+        v = norm_text(ws.value(r, label_col))
         if v and v.lower() == target:
             start_header = r
             break
@@ -258,8 +279,11 @@ def find_section_block_by_top_sections(
 
     end = ws.max_row + 1
     for r in range(start_header + 1, ws.max_row + 1):
-        v = norm_text(ws.cell(r, label_col).value)
-        if v and v.lower() in top_set and v.lower() != target:
+        v = norm_text(ws.value(r, label_col))
+        if not v:
+            continue
+        lc = v.lower()
+        if lc in top_set and lc != target:
             end = r
             break
 
@@ -273,15 +297,15 @@ def is_group_header_row(ws, r: int, label_col: int, type_col: int, value_col: in
     - type_col 비어있음
     - value_col 비어있음
     """
-    label = norm_text(ws.cell(r, label_col).value)
+    label = norm_text(ws.value(r, label_col))
     if not label:
         return False
 
-    t = ws.cell(r, type_col).value
+    t = ws.value(r, type_col)
     if t is not None and norm_text(t):
         return False
 
-    if ws.cell(r, value_col).value is not None:
+    if ws.value(r, value_col) is not None:
         return False
 
     return True
@@ -301,26 +325,24 @@ def extract_section_kv_for_project_flat(
     General inputs처럼 단순 Key-Value 추출
     - 빈값은 ""로 저장 가능
     """
+    value_letter = ws.col_letters[value_col]
+    conv = json_or_blank if include_empty_as_blank else to_json_value
     out: Dict[str, Any] = {}
     for r in range(start_row, end_row):
-        key = norm_text(ws.cell(r, label_col).value)
+        key = norm_text(ws.value(r, label_col))
         if not key:
             continue
 
-        val = to_json_value(ws.cell(r, value_col).value)
-        if include_empty_as_blank:
-            val = blank_if_empty(val)
+        val = conv(ws.value(r, value_col))
 
         if include_meta:
-            tval = to_json_value(ws.cell(r, type_col).value)
-            if include_empty_as_blank:
-                tval = blank_if_empty(tval)
+            tval = conv(ws.value(r, type_col))
             out[key] = {
                 "type": tval,
                 "value": val,
                 "row": r,
                 "col": value_col,
-                "col_letter": get_column_letter(value_col),
+                "col_letter": value_letter,
             }
         else:
             out[key] = val
@@ -344,11 +366,14 @@ def extract_section_kv_for_project_grouped(
       그 외 항목(Availability 등)은 그룹을 끊고 최상위로 저장
     - 빈값은 ""로 저장
     """
+    value_letter = ws.col_letters[value_col]
+    conv = json_or_blank if include_empty_as_blank else to_json_value
+    p_label_match = P_LABEL_RE.match
     out: Dict[str, Any] = {}
     current_group: Optional[str] = None
 
     for r in range(start_row, end_row):
-        label = norm_text(ws.cell(r, label_col).value)
+        label = norm_text(ws.value(r, label_col))
         if not label:
             continue
 
@@ -359,39 +384,33 @@ def extract_section_kv_for_project_grouped(
             continue
 
         # 그룹 유지 규칙: Pxx 라벨일 때만 current_group 유지
-        if current_group is not None and not P_LABEL_RE.match(label):
+        if current_group is not None and not p_label_match(label):
             current_group = None
 
-        val = to_json_value(ws.cell(r, value_col).value)
-        if include_empty_as_blank:
-            val = blank_if_empty(val)
+        val = conv(ws.value(r, value_col))
 
         if current_group:
             grp = out.setdefault(current_group, {})
             if include_meta:
-                tval = to_json_value(ws.cell(r, type_col).value)
-                if include_empty_as_blank:
-                    tval = blank_if_empty(tval)
+                tval = conv(ws.value(r, type_col))
                 grp[label] = {
                     "type": tval,
                     "value": val,
                     "row": r,
                     "col": value_col,
-                    "col_letter": get_column_letter(value_col),
+                    "col_letter": value_letter,
                 }
             else:
                 grp[label] = val
         else:
             if include_meta:
-                tval = to_json_value(ws.cell(r, type_col).value)
-                if include_empty_as_blank:
-                    tval = blank_if_empty(tval)
+                tval = conv(ws.value(r, type_col))
                 out[label] = {
                     "type": tval,
                     "value": val,
                     "row": r,
                     "col": value_col,
-                    "col_letter": get_column_letter(value_col),
+                    "col_letter": value_letter,
                 }
             else:
                 out[label] = val
@@ -403,9 +422,19 @@ def extract_gi_and_production_from_active_sheet(
     xlsx_path: str,
     label_col_letter: str = "B",
     include_meta: bool = False,
+    wb=None,
 ) -> Dict[str, Any]:
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
-    ws = wb.active  # 활성 시트만
+    # read_only 모드로 활성 시트만 iter_rows로 한 번 읽고 바로 닫는다
+    # (이미 연 wb를 넘기면 그대로 쓰고 닫는 것은 호출 측 몫)
+    own_wb = wb is None
+    if own_wb:
+        wb = load_workbook_values(xlsx_path)
+    try:
+        active = wb.active  # 활성 시트만
+        ws = SheetGrid(active, read_column_dimensions(xlsx_path, [active.title]).get(active.title, {}))
+    finally:
+        if own_wb:
+            wb.close()
 
     header_row, project_cols_map, hidden_project_cols, dropped_duplicates = find_project_header_row_visible(ws)
     project_col_indices = sorted(project_cols_map.keys())
@@ -415,8 +444,8 @@ def extract_gi_and_production_from_active_sheet(
     label_col = column_index_from_string(label_col_letter)
     type_col = label_col + 1
 
-    gi_block = find_section_block_by_top_sections(ws, label_col, "General inputs", TOP_LEVEL_SECTIONS)
-    prod_block = find_section_block_by_top_sections(ws, label_col, "Production", TOP_LEVEL_SECTIONS)
+    gi_block = find_section_block_by_top_sections(ws, label_col, "General inputs")
+    prod_block = find_section_block_by_top_sections(ws, label_col, "Production")
 
     missing_sections = []
     if gi_block is None:
@@ -427,7 +456,7 @@ def extract_gi_and_production_from_active_sheet(
     projects: List[Dict[str, Any]] = []
     for col_idx in project_col_indices:
         pname = project_cols_map[col_idx]
-        col_letter = get_column_letter(col_idx)
+        col_letter = ws.col_letters[col_idx]
 
         general_inputs: Dict[str, Any] = {}
         production: Dict[str, Any] = {}
@@ -474,7 +503,7 @@ def extract_gi_and_production_from_active_sheet(
             "project_header_row": header_row,
             "label_col": label_col_letter,
             "projects_detected": [project_cols_map[c] for c in project_col_indices],
-            "project_columns": [{"project": project_cols_map[c], "col": get_column_letter(c)} for c in project_col_indices],
+            "project_columns": [{"project": project_cols_map[c], "col": ws.col_letters[c]} for c in project_col_indices],
             "hidden_project_columns": hidden_project_cols,
             "dropped_duplicate_projects": dropped_duplicates,
             "missing_sections": missing_sections,
@@ -487,6 +516,15 @@ def extract_gi_and_production_from_active_sheet(
 # Opex - year 1 추출
 # -----------------------------
 
+def find_text_col(row: tuple, text: str, start: int, stop: int) -> int:
+    """row[start:stop] 중 strip/소문자화 값이 text(소문자)인 첫 열 인덱스, 없으면 -1."""
+    for c in range(start, min(stop, len(row))):
+        v = row[c]
+        if isinstance(v, str) and v.strip().lower() == text:
+            return c
+    return -1
+
+
 def find_opex_year1_sheet(wb) -> Optional[Any]:
     """
     'Opex - year 1' 시트를 자동 탐색
@@ -498,15 +536,12 @@ def find_opex_year1_sheet(wb) -> Optional[Any]:
         if "opex" in name and "year" in name and "1" in name:
             return ws
 
+    # read_only 워크시트이므로 셀 단위 접근 대신 상단 200행 x 60열만 행 단위로 읽는다
     target = "opex - year 1"
     for ws in wb.worksheets:
-        max_rows = min(ws.max_row, 200)
-        max_cols = min(ws.max_column, 60)
-        for r in range(1, max_rows + 1):
-            for c in range(1, max_cols + 1):
-                v = norm_text(ws.cell(r, c).value)
-                if v and v.lower() == target:
-                    return ws
+        for row in ws.iter_rows(max_row=200, max_col=60, values_only=True):
+            if find_text_col(row, target, 0, 60) != -1:
+                return ws
 
     return None
 
@@ -514,33 +549,24 @@ def find_opex_year1_sheet(wb) -> Optional[Any]:
 def find_opex_title_row_and_unit_col(ws) -> Tuple[int, int, int]:
     """
     Opex - year 1 표의 제목 행/라벨열/Unit 열을 찾습니다.
+    제목을 찾은 행 튜플에서 이어서 Unit을 찾으므로 상단 200행 x 80열을 한 번만 훑습니다.
     반환: (title_row, label_col, unit_col)
     """
     target = "opex - year 1"
     max_rows = min(ws.max_row, 200)
-    max_cols = min(ws.max_column, 80)
+    stop = min(ws.max_column, 80) + 1
 
     title_row = 1
     label_col = 1
 
     for r in range(1, max_rows + 1):
-        for c in range(1, max_cols + 1):
-            v = norm_text(ws.cell(r, c).value)
-            if v and v.lower() == target:
-                title_row = r
-                label_col = c
-                break
-        else:
-            continue
-        break
-
-    unit_col = -1
-    for c in range(label_col, max_cols + 1):
-        v = norm_text(ws.cell(title_row, c).value)
-        if v and v.lower() == "unit":
-            unit_col = c
+        c = find_text_col(ws.rows[r], target, 1, stop)
+        if c != -1:
+            title_row = r
+            label_col = c
             break
 
+    unit_col = find_text_col(ws.rows[title_row], "unit", label_col, stop)
     if unit_col == -1:
         unit_col = label_col + 2  # fallback
 
@@ -556,15 +582,15 @@ def build_project_cols_for_opex_sheet(ws, title_row: int, unit_col: int) -> Tupl
     try:
         _, project_cols_map, _, _ = find_project_header_row_visible(ws)
         cols = sorted(project_cols_map.keys())
-        return project_cols_map, [{"project": project_cols_map[c], "col": get_column_letter(c)} for c in cols]
+        return project_cols_map, [{"project": project_cols_map[c], "col": ws.col_letters[c]} for c in cols]
     except Exception:
         project_cols_map: Dict[int, str] = {}
         started = False
         idx = 1
         for c in range(unit_col + 1, ws.max_column + 1):
-            if not is_column_visible(ws, c):
+            if not ws.visible[c]:
                 continue
-            txt = norm_text(ws.cell(title_row, c).value)
+            txt = norm_text(ws.value(title_row, c))
             if txt is None:
                 if started:
                     break
@@ -574,39 +600,48 @@ def build_project_cols_for_opex_sheet(ws, title_row: int, unit_col: int) -> Tupl
             idx += 1
 
         cols = sorted(project_cols_map.keys())
-        return project_cols_map, [{"project": project_cols_map[c], "col": get_column_letter(c)} for c in cols]
+        return project_cols_map, [{"project": project_cols_map[c], "col": ws.col_letters[c]} for c in cols]
 
 
-def is_opex_category_header(ws, r: int, label_col: int) -> bool:
+def opex_category_header_flags(ws, label_col: int) -> List[bool]:
     """
-    Opex 카테고리 헤더 판별:
+    행별 Opex 카테고리 헤더 여부 (인덱스는 행 번호):
     - label 문자열 존재
     - label이 필드 라벨(OPEX_FIELD_LABELS)이 아님
     - 아래 1~5행 내에 Currency/Cost 등의 필드 라벨이 등장하면 카테고리로 판단
+    아래에서 위로 한 번 훑으며 가장 가까운 아래쪽 필드 라벨 행을 기억하므로 행마다 lookahead하지 않음.
     """
-    label = norm_text(ws.cell(r, label_col).value)
-    if not label:
-        return False
-
-    if label.strip().lower() in OPEX_FIELD_LABELS:
-        return False
-
-    for rr in range(r + 1, min(r + 6, ws.max_row + 1)):
-        nxt = norm_text(ws.cell(rr, label_col).value)
-        if nxt and nxt.strip().lower() in OPEX_FIELD_LABELS:
-            return True
-
-    return False
+    flags = [False] * (ws.max_row + 1)
+    next_field_row = ws.max_row + 6  # 아래에 필드 라벨이 없으면 어떤 행에서도 5행 밖
+    for r in range(ws.max_row, 0, -1):
+        label = norm_text(ws.value(r, label_col))
+        if not label:
+            continue
+        if label.lower() in OPEX_FIELD_LABELS:
+            next_field_row = r
+        else:
+            flags[r] = next_field_row - r <= 5
+    return flags
 
 
 def extract_opex_year1_from_sheet(
     xlsx_path: str,
     include_meta: bool = False,
+    wb=None,
 ) -> Dict[str, Any]:
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
-    ws = find_opex_year1_sheet(wb)
-    if ws is None:
-        raise RuntimeError("Opex - year 1 시트를 찾지 못했습니다(시트명/내용에서 미탐지).")
+    # read_only 모드로 열어 찾은 시트만 iter_rows로 한 번 읽고 바로 닫는다
+    # (이미 연 wb를 넘기면 그대로 쓰고 닫는 것은 호출 측 몫)
+    own_wb = wb is None
+    if own_wb:
+        wb = load_workbook_values(xlsx_path)
+    try:
+        ws = find_opex_year1_sheet(wb)
+        if ws is None:
+            raise RuntimeError("Opex - year 1 시트를 찾지 못했습니다(시트명/내용에서 미탐지).")
+        ws = SheetGrid(ws, read_column_dimensions(xlsx_path, [ws.title]).get(ws.title, {}))
+    finally:
+        if own_wb:
+            wb.close()
 
     title_row, label_col, unit_col = find_opex_title_row_and_unit_col(ws)
     prompt_col = label_col + 1
@@ -616,99 +651,102 @@ def extract_opex_year1_from_sheet(
     if not project_col_indices:
         raise RuntimeError("Opex - year 1에서 프로젝트 값 열을 찾지 못했습니다.")
 
+    col_letters = ws.col_letters
+
     # 프로젝트별 결과
     per_project: Dict[int, Dict[str, Any]] = {}
     for c in project_col_indices:
         per_project[c] = {
             "name": project_cols_map[c],
-            "col": get_column_letter(c),
+            "col": col_letters[c],
             "opex_year1": {},
         }
 
+    # 프로젝트 열 순서(i)로 접근하는 병렬 리스트. cat_dicts는 카테고리가 바뀔 때만 갱신
+    proj_opex = [per_project[c]["opex_year1"] for c in project_col_indices]
+    proj_col_letters = [col_letters[c] for c in project_col_indices]
+    cat_dicts: List[Dict[str, Any]] = []
+
+    is_category_header = opex_category_header_flags(ws, label_col)
     current_category: Optional[str] = None
 
+    # 행 루프에서 반복 참조하는 함수/메서드는 지역 이름으로 묶어 전역 조회를 줄인다
+    value = ws.value
+    norm = norm_text
+    to_blank = json_or_blank
+    norm_indexed = normalize_indexed_value
+
     for r in range(title_row + 1, ws.max_row + 1):
-        label = norm_text(ws.cell(r, label_col).value)
+        label = norm(value(r, label_col))
         if not label:
             continue
+        # Indexed?/Comments 판별에 같은 소문자 라벨을 재사용
+        key_lower = label.lower()
+
+        # 프로젝트 열 값은 행마다 한 번만 꺼내고 변환
+        vals = [to_blank(value(r, c)) for c in project_col_indices]
 
         # 카테고리 헤더
-        if is_opex_category_header(ws, r, label_col):
+        if is_category_header[r]:
             current_category = label
-            for c in project_col_indices:
-                per_project[c]["opex_year1"].setdefault(current_category, {})
+            cat_dicts = [po.setdefault(current_category, {}) for po in proj_opex]
 
             # 카테고리 헤더 행에 값(예: 1)이 있으면 enabled로 저장 (빈값은 "")
-            any_val = False
-            header_vals: Dict[int, Any] = {}
-            for c in project_col_indices:
-                v = blank_if_empty(to_json_value(ws.cell(r, c).value))
-                header_vals[c] = v
-                if v != "":
-                    any_val = True
-
-            if any_val:
-                for c in project_col_indices:
-                    per_project[c]["opex_year1"][current_category]["enabled"] = header_vals[c]
+            if any(v != "" for v in vals):
+                for cd, v in zip(cat_dicts, vals):
+                    cd["enabled"] = v
 
             continue
 
         if current_category is None:
             current_category = "Opex - year 1"
-            for c in project_col_indices:
-                per_project[c]["opex_year1"].setdefault(current_category, {})
+            cat_dicts = [po.setdefault(current_category, {}) for po in proj_opex]
 
         key = label
-        key_lower = key.strip().lower()
-
-        unit_val = blank_if_empty(to_json_value(ws.cell(r, unit_col).value))
-        prompt_val = blank_if_empty(to_json_value(ws.cell(r, prompt_col).value))
 
-        # 프로젝트별 값을 먼저 수집
-        row_vals: Dict[int, Any] = {}
-        for c in project_col_indices:
-            v = blank_if_empty(to_json_value(ws.cell(r, c).value))
+        unit_val = to_blank(value(r, unit_col))
+        prompt_val = to_blank(value(r, prompt_col))
 
-            # Indexed? 0/1 -> No/Yes
-            if key_lower == "indexed?":
-                v = normalize_indexed_value(v)
-
-            row_vals[c] = v
+        # Indexed? 0/1 -> No/Yes
+        if key_lower == "indexed?":
+            row_vals = [norm_indexed(v) for v in vals]
+        else:
+            row_vals = vals
 
         # Comments: 프로젝트별 값이 하나라도 있으면 그걸 사용, 전부 비었으면 prompt 사용
         if key_lower == "comments":
-            any_project_comment = any(row_vals[c] != "" for c in project_col_indices)
+            any_project_comment = any(v != "" for v in row_vals)
             final_comment_prompt = prompt_val if (not any_project_comment and prompt_val != "") else ""
 
-            for c in project_col_indices:
-                final_val = row_vals[c] if any_project_comment else (final_comment_prompt or "")
+            for i, cd in enumerate(cat_dicts):
+                final_val = row_vals[i] if any_project_comment else (final_comment_prompt or "")
                 if include_meta:
-                    per_project[c]["opex_year1"][current_category][key] = {
+                    cd[key] = {
                         "unit": unit_val,
                         "prompt": prompt_val,
                         "value": final_val,
                         "row": r,
-                        "col": c,
-                        "col_letter": get_column_letter(c),
+                        "col": project_col_indices[i],
+                        "col_letter": proj_col_letters[i],
                     }
                 else:
-                    per_project[c]["opex_year1"][current_category][key] = final_val
+                    cd[key] = final_val
             continue
 
         # 일반 필드 저장
-        for c in project_col_indices:
-            v = row_vals[c]
+        for i, cd in enumerate(cat_dicts):
+            v = row_vals[i]
             if include_meta:
-                per_project[c]["opex_year1"][current_category][key] = {
+                cd[key] = {
                     "unit": unit_val,
                     "prompt": prompt_val,
                     "value": v,
                     "row": r,
-                    "col": c,
-                    "col_letter": get_column_letter(c),
+                    "col": project_col_indices[i],
+                    "col_letter": proj_col_letters[i],
                 }
             else:
-                per_project[c]["opex_year1"][current_category][key] = v
+                cd[key] = v
 
     projects = [per_project[c] for c in project_col_indices]
 
@@ -780,15 +818,22 @@ def main():
         print(f"     projects: {len(result['projects'])}")
 
     else:  # all
-        gi_prod = extract_gi_and_production_from_active_sheet(
-            xlsx_path=args.xlsx,
-            label_col_letter=args.label_col,
-            include_meta=args.include_meta,
-        )
-        opex1 = extract_opex_year1_from_sheet(
-            xlsx_path=args.xlsx,
-            include_meta=args.include_meta,
-        )
+        # 워크북(공유 문자열/스타일)은 한 번만 로드해 두 추출에 같이 사용
+        wb = load_workbook_values(args.xlsx)
+        try:
+            gi_prod = extract_gi_and_production_from_active_sheet(
+                xlsx_path=args.xlsx,
+                label_col_letter=args.label_col,
+                include_meta=args.include_meta,
+                wb=wb,
+            )
+            opex1 = extract_opex_year1_from_sheet(
+                xlsx_path=args.xlsx,
+                include_meta=args.include_meta,
+                wb=wb,
+            )
+        finally:
+            wb.close()
         out1 = save_json("gi_prod.json", gi_prod)
         out2 = save_json("opex_year1.json", opex1)
         print(f"[OK] saved: {out1}")
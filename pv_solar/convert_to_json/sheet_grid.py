@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""convert_to_json 변환기(capex/opex/extract_general_inputs)가 공유하는 read_only 시트 격자."""
+
+import posixpath
+import zipfile
+from typing import Any, Dict, Iterable, List, Optional
+from xml.etree.ElementTree import iterparse, parse as parse_xml
+
+from openpyxl.utils.cell import get_column_letter
+
+
+def _local(tag: str) -> str:
+    """'{namespace}name' -> 'name' (Transitional/Strict 네임스페이스 모두 처리)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _rel_targets(zf: zipfile.ZipFile, part: str) -> Dict[str, str]:
+    """part의 관계(.rels) 파일을 읽어 {rId: 대상 part 경로(zip 내부 이름)}를 반환."""
+    base_dir, name = posixpath.split(part)
+    rels_name = posixpath.join(base_dir, "_rels", name + ".rels")
+    if rels_name not in zf.NameToInfo:
+        return {}
+    targets: Dict[str, str] = {}
+    with zf.open(rels_name) as src:
+        for rel in parse_xml(src).getroot():
+            target = rel.get("Target") or ""
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join(base_dir, target))
+            targets[rel.get("Id")] = path
+    return targets
+
+
+def _workbook_part(zf: zipfile.ZipFile) -> str:
+    """패키지 루트 관계에서 officeDocument(워크북) part 경로를 찾는다."""
+    with zf.open("_rels/.rels") as src:
+        for rel in parse_xml(src).getroot():
+            if (rel.get("Type") or "").endswith("/officeDocument"):
+                return (rel.get("Target") or "").lstrip("/")
+    return "xl/workbook.xml"
+
+
+def _read_cols(zf: zipfile.ZipFile, part: str) -> Dict[int, Dict[str, str]]:
+    """시트 XML에서 <sheetData> 앞의 <cols>만 읽는다. <col min=..>의 시작 열 인덱스가 키."""
+    dims: Dict[int, Dict[str, str]] = {}
+    with zf.open(part) as src:
+        for event, el in iterparse(src, events=("start", "end")):
+            tag = _local(el.tag)
+            if event == "start":
+                if tag == "sheetData":
+                    break
+                continue
+            if tag == "col":
+                dims[int(el.get("min"))] = dict(el.attrib)
+    return dims
+
+
+def read_column_dimensions(
+    xlsx_path: str,
+    sheet_titles: Optional[Iterable[str]] = None,
+) -> Dict[str, Dict[int, Dict[str, str]]]:
+    """
+    read_only 워크시트는 column_dimensions를 제공하지 않으므로 xlsx(zip)의 시트 XML에서 <cols>만 직접 읽는다.
+    시트 이름 -> part 경로는 workbook.xml과 그 관계 파일로 찾는다.
+    반환: {시트 제목: {열 인덱스(<col min>): 속성 dict}}  (일반 모드 openpyxl과 같이 시작 열만 키로 저장)
+    sheet_titles를 주면 그 시트만 읽는다.
+    """
+    wanted = None if sheet_titles is None else set(sheet_titles)
+    out: Dict[str, Dict[int, Dict[str, str]]] = {}
+    with zipfile.ZipFile(xlsx_path) as zf:
+        wb_part = _workbook_part(zf)
+        targets = _rel_targets(zf, wb_part)
+        with zf.open(wb_part) as src:
+            sheets = [el for el in parse_xml(src).getroot().iter() if _local(el.tag) == "sheet"]
+        for sheet in sheets:
+            title = sheet.get("name")
+            if wanted is not None and title not in wanted:
+                continue
+            r_id = next((v for k, v in sheet.attrib.items() if _local(k) == "id"), None)
+            part = targets.get(r_id)
+            out[title] = _read_cols(zf, part) if part in zf.NameToInfo else {}
+    return out
+
+
+def visible_columns(column_dimensions: Dict[int, Dict[str, str]], width: int) -> List[bool]:
+    """
+    열 인덱스별 '실질적으로 눈에 보이는 열' 여부
+    - hidden=True 또는 width=0이면 False
+    """
+    visible = [True] * width
+    for col_idx, dim in column_dimensions.items():
+        if col_idx >= width:
+            continue
+
+        # openpyxl Bool 규칙: 'false'/'f'/'0' 외의 비어 있지 않은 문자열은 True
+        hidden = dim.get("hidden")
+        if hidden and hidden not in ("false", "f", "0"):
+            visible[col_idx] = False
+            continue
+
+        w = dim.get("width")
+        if w is not None:
+            try:
+                if float(w) == 0.0:
+                    visible[col_idx] = False
+            except Exception:
+                pass
+    return visible
+
+
+class SheetGrid:
+    """
+    read_only 워크시트 값을 iter_rows로 한 번에 읽어 둔 격자.
+    ws.cell(r, c).value 대신 rows[r][c]로 1-based 접근한다.
+    모든 행을 max_column 길이로 채워 두므로 1..max_row, 1..max_column 범위는 경계 검사 없이 인덱싱 가능.
+    범위를 벗어날 수 있는 좌표(사용자 지정 열, fallback 열 등)는 value(r, c) / column(c)로 읽는다(범위 밖은 None).
+    visible[c] / col_letters[c]도 같은 범위로 미리 계산해 둔다.
+    """
+
+    __slots__ = ("title", "rows", "max_row", "max_column", "visible", "col_letters")
+
+    def __init__(self, ws, column_dimensions: Dict[int, Dict[str, str]]) -> None:
+        self.title = ws.title
+        # 저장된 <dimension> 태그는 없거나 틀릴 수 있으므로(Excel 외 작성기) 무시하고
+        # 일반 모드 openpyxl처럼 실제 셀 데이터로 범위를 정한다
+        ws.reset_dimensions()
+        raw = [tuple(row) for row in ws.iter_rows(values_only=True)]
+        # 셀이 하나도 없는 끝쪽 행은 일반 모드 max_row에 들어가지 않음
+        while raw and not raw[-1]:
+            raw.pop()
+        self.max_row = max(1, len(raw))
+        self.max_column = max(1, max((len(row) for row in raw), default=0))
+        width = self.max_column + 1
+        # 0번 행/열은 비워 두어 Excel과 같은 1-based 인덱스를 그대로 사용
+        empty_row = (None,) * width
+        self.rows: List[tuple] = [empty_row]
+        for row in raw:
+            self.rows.append((None,) + row + (None,) * (width - 1 - len(row)))
+        if not raw:
+            self.rows.append(empty_row)
+        self.visible = visible_columns(column_dimensions, width)
+        self.col_letters = [""] + [get_column_letter(c) for c in range(1, width)]
+
+    def value(self, r: int, c: int) -> Any:
+        """(r, c) 값. 시트 범위 밖이면 None."""
+        if 0 < r <= self.max_row and 0 < c <= self.max_column:
+            return self.rows[r][c]
+        return None
+
+    def column(self, c: int) -> List[Any]:
+        """c열 값 목록 (인덱스는 행 번호). 시트 범위 밖 열은 전부 None."""
+        if c > self.max_column:
+            return [None] * len(self.rows)
+        return [row[c] for row in self.rows]